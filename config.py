@@ -0,0 +1,169 @@
+"""
+Configuration for the Onchain MCP Server
+API keys are read from the environment - see .env.example
+"""
+
+import functools
+import os
+from dataclasses import dataclass, field
+from enum import IntEnum
+from types import MappingProxyType
+
+# Networks served through Alchemy, by endpoint host
+ALCHEMY_HOSTS = {
+    "mainnet": "eth-mainnet.g.alchemy.com",
+    "sepolia": "eth-sepolia.g.alchemy.com",
+    "polygon": "polygon-mainnet.g.alchemy.com",
+    "arbitrum": "arb-mainnet.g.alchemy.com",
+    "optimism": "opt-mainnet.g.alchemy.com",
+    "base": "base-mainnet.g.alchemy.com",
+    "scroll": "scroll-mainnet.g.alchemy.com",
+    "blast": "blast-mainnet.g.alchemy.com",
+    "hyperliquid": "hyperliquid-mainnet.g.alchemy.com",
+    "solana": "solana-mainnet.g.alchemy.com",
+    "plasma": "plasma-mainnet.g.alchemy.com",
+}
+
+# Networks served by public endpoints that need no key
+PUBLIC_RPC_URLS = {
+    "bsc": "https://bsc-dataseed.binance.org",
+    "avalanche": "https://api.avax.network/ext/bc/C/rpc",
+}
+
+# Public mirrors raced against the primary endpoint for read-only requests;
+# only used when ENABLE_RPC_MIRRORS is set, since it sends queries to third parties
+RPC_MIRRORS = {
+    "mainnet": ("https://ethereum-rpc.publicnode.com",),
+    "sepolia": ("https://ethereum-sepolia-rpc.publicnode.com",),
+    "polygon": ("https://polygon-bor-rpc.publicnode.com",),
+    "arbitrum": ("https://arb1.arbitrum.io/rpc",),
+    "optimism": ("https://mainnet.optimism.io",),
+    "bsc": ("https://bsc-rpc.publicnode.com",),
+    "avalanche": ("https://avalanche-c-chain-rpc.publicnode.com",),
+    "base": ("https://mainnet.base.org",),
+    "scroll": ("https://rpc.scroll.io",),
+    "blast": ("https://rpc.blast.io",),
+}
+
+
+@dataclass(slots=True, frozen=True)
+class Limits:
+    """Request limits applied per network"""
+    max_requests_per_minute: int = 100
+    max_concurrent_requests: int = 10
+    request_timeout: int = 30  # seconds
+
+
+@dataclass(slots=True, frozen=True)
+class Config:
+    """Server configuration; fields after rpc_mirrors are derived lookups"""
+    rpc_urls: MappingProxyType
+    supported_chains: MappingProxyType
+    limits: Limits
+    default_network: str
+    etherscan_api_key: str
+    etherscan_v2_url: str
+    rpc_mirrors: MappingProxyType
+    networks: MappingProxyType = field(init=False)
+    chain_to_network: MappingProxyType = field(init=False)
+    supported_networks: frozenset = field(init=False)
+    supported_chain_ids: frozenset = field(init=False)
+    Network: type = field(init=False)
+
+    def __post_init__(self):
+        # Precomputed lookups so tools resolve a network with a single dict probe
+        object.__setattr__(self, "networks", MappingProxyType({
+            network: (self.supported_chains[network], rpc_url)
+            for network, rpc_url in self.rpc_urls.items()
+        }))
+        object.__setattr__(self, "chain_to_network", MappingProxyType({
+            chain_id: network for network, chain_id in self.supported_chains.items()
+        }))
+        object.__setattr__(self, "supported_networks", frozenset(self.supported_chains.keys()))
+        object.__setattr__(self, "supported_chain_ids", frozenset(self.supported_chains.values()))
+        object.__setattr__(self, "Network", IntEnum("Network", {
+            network.upper(): chain_id for network, chain_id in self.supported_chains.items()
+        }))
+
+    def resolve_network(self, network):
+        """
+        Normalize a network given by name, chain id or Network member.
+
+        Args:
+            network: Network name (any case), chain id or Network member
+
+        Returns:
+            The lowercase network name used as key in rpc_urls
+
+        Raises:
+            ValueError: If the network is not configured
+        """
+        # Fast path for the canonical name every MCP client sends
+        if network in self.supported_networks:
+            return network
+        if isinstance(network, str):
+            member = self.Network.__members__.get(network.upper())
+        else:
+            member = self.Network._value2member_map_.get(network)
+        if member is None:
+            raise ValueError(f"Network {network} not supported. Supported networks: {list(self.networks)}")
+        return member.name.lower()
+
+
+@functools.cache
+def get_config():
+    """
+    Build the configuration on first access.
+    
+    Secrets are read from the environment:
+        ALCHEMY_API_KEY: Key for the Alchemy RPC endpoints
+        ETHERSCAN_API_KEY: Key for the Etherscan V2 API
+    
+    Options:
+        ENABLE_RPC_MIRRORS: Set to 1 to race read-only requests against RPC_MIRRORS
+    
+    Returns:
+        Frozen Config with the server configuration
+    """
+    alchemy_key = os.getenv("ALCHEMY_API_KEY", "YOUR_ALCHEMY_API_KEY")
+    mirrors_enabled = os.getenv("ENABLE_RPC_MIRRORS", "").lower() in ("1", "true", "yes")
+    
+    return Config(
+        rpc_urls=MappingProxyType({
+            **{network: f"https://{host}/v2/{alchemy_key}" for network, host in ALCHEMY_HOSTS.items()},
+            **PUBLIC_RPC_URLS,
+        }),
+        limits=Limits(
+            max_requests_per_minute=100,
+            max_concurrent_requests=10,
+            request_timeout=30,  # seconds
+        ),
+        default_network="mainnet",
+        etherscan_api_key=os.getenv("ETHERSCAN_API_KEY", "YOUR_ETHERSCAN_API_KEY"),
+        etherscan_v2_url="https://api.etherscan.io/v2/api",
+        rpc_mirrors=MappingProxyType(RPC_MIRRORS if mirrors_enabled else {}),
+        supported_chains=MappingProxyType({
+            "mainnet": 1,
+            "sepolia": 11155111,
+            "polygon": 137,
+            "arbitrum": 42161,
+            "optimism": 10,
+            "bsc": 56,
+            "avalanche": 43114,
+            "base": 8453,
+            "scroll": 534352,
+            "blast": 81457,
+            "hyperliquid": 999,  # Hyperliquid uses Arbitrum-compatible chain ID
+            "solana": 101,  # Solana mainnet
+            "plasma": 9745,  # Plasma uses Ethereum-compatible chain ID
+        }),
+    )
+
+
+def __getattr__(name):
+    # Keeps `from config import config` working while deferring construction to first use
+    if name == "config":
+        return get_config()
+    if name == "Network":
+        return get_config().Network
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,14 +4,34 @@ Contract Audit Prompts
 Professional prompt templates for smart contract security analysis and auditing.
 """
 
-def contract_security_audit_prompt():
+from string import Formatter
+
+
+class PromptTemplate:
     """
-    Comprehensive security audit prompt for smart contracts.
-    
-    Returns:
-        str: Formatted prompt template for contract security analysis
+    Prompt text with its {placeholder} fields parsed once at import.
+
+    render() substitutes values by walking the pre-parsed segments instead of
+    re-parsing the format string on every call. Fields without a value are
+    left as {field}, like string.Template.safe_substitute.
     """
-    return """
+
+    __slots__ = ("text", "segments")
+
+    def __init__(self, text):
+        self.text = text
+        self.segments = tuple((literal, field) for literal, field, _, _ in Formatter().parse(text))
+
+    def render(self, **values):
+        parts = []
+        for literal, field in self.segments:
+            parts.append(literal)
+            if field is not None:
+                parts.append(str(values[field]) if field in values else "{" + field + "}")
+        return "".join(parts)
+
+
+SECURITY_AUDIT_TEMPLATE = PromptTemplate("""
 🔍 **SMART CONTRACT SECURITY AUDIT**
 
 Please analyze the following smart contract and provide a comprehensive security audit:
@@ -76,17 +96,10 @@ Please analyze the following smart contract and provide a comprehensive security
 - Gas consumption patterns
 
 **Format the output as a professional security audit report with clear sections, risk ratings, and actionable recommendations. Use emojis and formatting to make it readable and professional.**
-"""
+""")
 
 
-def contract_quick_analysis_prompt():
-    """
-    Quick contract analysis prompt for rapid assessment.
-    
-    Returns:
-        str: Formatted prompt template for quick contract analysis
-    """
-    return """
+QUICK_ANALYSIS_TEMPLATE = PromptTemplate("""
 ⚡ **QUICK CONTRACT ANALYSIS**
 
 Provide a rapid assessment of this contract:
@@ -104,17 +117,10 @@ Provide a rapid assessment of this contract:
 **One-liner Summary:** [Brief description of what this contract does and main risk]
 
 Keep it concise but informative!
-"""
+""")
 
 
-def contract_deep_dive_prompt():
-    """
-    Deep dive analysis prompt for comprehensive contract examination.
-    
-    Returns:
-        str: Formatted prompt template for deep contract analysis
-    """
-    return """
+DEEP_DIVE_TEMPLATE = PromptTemplate("""
 🔬 **DEEP DIVE CONTRACT ANALYSIS**
 
 Conduct a thorough examination of this contract:
@@ -168,4 +174,34 @@ Conduct a thorough examination of this contract:
 - Monitoring capabilities
 
 **Provide detailed technical analysis with code references, risk assessments, and comprehensive recommendations.**
-"""
+""")
+
+
+def contract_security_audit_prompt():
+    """
+    Comprehensive security audit prompt for smart contracts.
+    
+    Returns:
+        str: Formatted prompt template for contract security analysis
+    """
+    return SECURITY_AUDIT_TEMPLATE.text
+
+
+def contract_quick_analysis_prompt():
+    """
+    Quick contract analysis prompt for rapid assessment.
+    
+    Returns:
+        str: Formatted prompt template for quick contract analysis
+    """
+    return QUICK_ANALYSIS_TEMPLATE.text
+
+
+def contract_deep_dive_prompt():
+    """
+    Deep dive analysis prompt for comprehensive contract examination.
+    
+    Returns:
+        str: Formatted prompt template for deep contract analysis
+    """
+    return DEEP_DIVE_TEMPLATE.text
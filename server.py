@@ -5,14 +5,23 @@ A Model Context Protocol server that provides tools for querying onchain data
 including ETH balances and ERC20 token balances.
 """
 
-import os
-import sys
-from pathlib import Path
+from contextlib import asynccontextmanager
 from mcp.server.fastmcp import FastMCP
-from config import config
+from tools._rpc import rpc_client
+
+
+@asynccontextmanager
+async def lifespan(server):
+    """Close the shared HTTP sessions on shutdown"""
+    try:
+        yield
+    finally:
+        await rpc_client.close()
+        await close_etherscan_session()
+
 
 # Create the MCP server
-mcp = FastMCP("onchain-mcp")
+mcp = FastMCP("onchain-mcp", lifespan=lifespan)
 
 # Import and register tools
 from tools.eth_balance import eth_balance_tool
@@ -21,7 +30,7 @@ from tools.nft_balance import nft_balance_tool
 from tools.tx_get import tx_get_tool
 from tools.logs_query import logs_tool
 from tools.token_metadata import token_metadata_tool
-from tools.contract_audit import contract_audit_tool
+from tools.contract_audit import contract_audit_tool, close_etherscan_session
 
 # Import prompts
 from prompts.contract_audit import (
@@ -30,20 +39,36 @@ from prompts.contract_audit import (
     contract_deep_dive_prompt
 )
 
-# Register tools with the server
-mcp.tool()(eth_balance_tool)
-mcp.tool()(erc20_balance_tool)
-mcp.tool()(nft_balance_tool)
-mcp.tool()(tx_get_tool)
-mcp.tool()(logs_tool)
-mcp.tool()(token_metadata_tool)
-mcp.tool()(contract_audit_tool)
+TOOLS = (
+    eth_balance_tool,
+    erc20_balance_tool,
+    nft_balance_tool,
+    tx_get_tool,
+    logs_tool,
+    token_metadata_tool,
+    contract_audit_tool,
+)
+
+PROMPTS = (
+    contract_security_audit_prompt,
+    contract_quick_analysis_prompt,
+    contract_deep_dive_prompt,
+)
 
-# Register prompts with the server
-mcp.prompt()(contract_security_audit_prompt)
-mcp.prompt()(contract_quick_analysis_prompt)
-mcp.prompt()(contract_deep_dive_prompt)
+# Register tools and prompts with the server
+for tool in TOOLS:
+    mcp.tool()(tool)
+
+for prompt in PROMPTS:
+    mcp.prompt()(prompt)
 
 if __name__ == "__main__":
+    # libuv-backed event loop where available; the stdlib loop otherwise (e.g. Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     # Run the server
     mcp.run()
@@ -0,0 +1,29 @@
+"""
+Address Normalization
+
+User-supplied addresses are checksummed once where a tool starts, so web3's
+contract factory and request formatters accept them as given. The same
+wallets and tokens come back across calls, so the keccak behind each
+checksum is memoized.
+"""
+
+import functools
+
+from eth_utils import to_checksum_address
+
+
+@functools.lru_cache(maxsize=4096)
+def checksum_address(address):
+    """
+    EIP-55 checksum an address.
+
+    Args:
+        address: Hex address in any case
+
+    Returns:
+        The checksummed address
+
+    Raises:
+        ValueError: If address is not a 20-byte hex address
+    """
+    return to_checksum_address(address)
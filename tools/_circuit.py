@@ -0,0 +1,90 @@
+"""
+Per-Endpoint Circuit Breaker
+
+Stops sending requests to an RPC host that keeps failing. After
+FAILURE_THRESHOLD failures within FAILURE_WINDOW seconds the circuit opens
+and calls fail fast; after COOLDOWN seconds it half-opens to let traffic
+probe the host again, closing on the first success.
+"""
+
+import time
+from urllib.parse import urlsplit
+
+# Failures within FAILURE_WINDOW seconds that trip the circuit open
+FAILURE_THRESHOLD = 5
+FAILURE_WINDOW = 10.0
+
+# Seconds an open circuit rejects calls before half-opening
+COOLDOWN = 30.0
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class ProviderUnavailable(ConnectionError):
+    """Raised instead of calling a host whose circuit is open"""
+
+
+class CircuitBreaker:
+    """
+    Closed / open / half-open breaker for one RPC host.
+
+    Args:
+        host: The host name, used in error messages
+    """
+
+    def __init__(self, host):
+        self.host = host
+        self.state = CLOSED
+        self.failures = 0
+        self.first_failure_at = 0.0
+        self.opened_at = 0.0
+
+    def allow(self):
+        """True if a request may be sent to the host now"""
+        if self.state == OPEN and time.monotonic() - self.opened_at >= COOLDOWN:
+            self.state = HALF_OPEN
+        return self.state != OPEN
+
+    def on_success(self):
+        """Close the circuit after the host answered"""
+        self.state = CLOSED
+        self.failures = 0
+
+    def on_failure(self):
+        """Count a failed request, opening the circuit past the threshold"""
+        now = time.monotonic()
+        if self.state == HALF_OPEN:
+            # The probe failed - back to open for another cooldown
+            self.state = OPEN
+            self.opened_at = now
+            return
+
+        if now - self.first_failure_at > FAILURE_WINDOW:
+            self.failures = 0
+            self.first_failure_at = now
+        self.failures += 1
+        if self.failures >= FAILURE_THRESHOLD:
+            self.state = OPEN
+            self.opened_at = now
+
+
+def build_circuits(urls):
+    """
+    Create one breaker per RPC host and map every endpoint onto its host's breaker.
+
+    Args:
+        urls: Iterable of RPC endpoint URLs
+
+    Returns:
+        Dictionary mapping endpoint URL to its CircuitBreaker
+    """
+    by_host = {}
+    circuits = {}
+    for url in urls:
+        host = urlsplit(url).netloc
+        if host not in by_host:
+            by_host[host] = CircuitBreaker(host)
+        circuits[url] = by_host[host]
+    return circuits
@@ -0,0 +1,126 @@
+"""
+Multicall3 Aggregation
+
+Pack several read-only contract calls into one Multicall3.aggregate3 eth_call.
+Networks where the aggregate call is unavailable fall back to one eth_call per
+target, which the batch client still sends as a single JSON-RPC batch.
+"""
+
+import asyncio
+
+from eth_abi import decode, encode
+from eth_abi.exceptions import DecodingError
+from hexbytes import HexBytes
+from web3.exceptions import ContractLogicError, Web3RPCError
+
+# Deployed at the same address on every EVM chain via a deterministic deployer
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+AGGREGATE3_SELECTOR = bytes.fromhex("82ad56cb")
+GET_ETH_BALANCE_SELECTOR = bytes.fromhex("4d2301cc")
+
+# Configured networks without Multicall3 at the canonical address
+UNSUPPORTED_NETWORKS = frozenset({"solana"})
+
+
+def eth_balance_call(address):
+    """Build the (target, calldata) pair for Multicall3.getEthBalance(address)"""
+    return MULTICALL3_ADDRESS, GET_ETH_BALANCE_SELECTOR + encode(["address"], [address])
+
+
+async def _call_each(w3, calls):
+    """Issue the calls individually; they still go out in one JSON-RPC batch"""
+    async def call(target, calldata):
+        try:
+            return True, bytes(await w3.eth.call({"to": target, "data": calldata}))
+        except (ContractLogicError, Web3RPCError):
+            return False, b""
+
+    return list(await asyncio.gather(*(call(target, calldata) for target, calldata in calls)))
+
+
+async def aggregate3(w3, network, calls):
+    """
+    Execute read-only calls through Multicall3.aggregate3.
+
+    Args:
+        w3: AsyncWeb3 instance for the network
+        network: The network name, used to skip chains without Multicall3
+        calls: List of (target address, calldata bytes) tuples
+
+    Returns:
+        List of (success, return data bytes) tuples in call order
+    """
+    if network not in UNSUPPORTED_NETWORKS:
+        payload = AGGREGATE3_SELECTOR + encode(
+            ["(address,bool,bytes)[]"],
+            [[(target, True, calldata) for target, calldata in calls]]
+        )
+        try:
+            raw = await w3.eth.call({"to": MULTICALL3_ADDRESS, "data": payload})
+            (results,) = decode(["(bool,bytes)[]"], raw)
+            return [(success, bytes(data)) for success, data in results]
+        except (ContractLogicError, Web3RPCError, DecodingError):
+            # No Multicall3 deployed (empty return) or the provider refused the call
+            pass
+
+    return await _call_each(w3, calls)
+
+
+async def call_functions(w3, network, contract, queries):
+    """
+    Call several view functions of one contract in a single aggregate3 eth_call.
+
+    Args:
+        w3: AsyncWeb3 instance for the network
+        network: The network name
+        contract: web3 contract instance exposing the functions
+        queries: List of (function name, args, output type) tuples
+
+    Returns:
+        List of decoded return values in query order
+
+    Raises:
+        ValueError: If any of the calls reverted
+    """
+    results = await aggregate3(w3, network, [
+        (contract.address, HexBytes(contract.encode_abi(fn_name, args=args)))
+        for fn_name, args, _ in queries
+    ])
+
+    values = []
+    for (fn_name, _, output_type), (success, data) in zip(queries, results):
+        if not success:
+            raise ValueError(f"{fn_name}() call failed on {contract.address}")
+        values.append(w3.codec.decode([output_type], data)[0])
+    return values
+
+
+async def try_call_functions(w3, network, calls):
+    """
+    Call view functions across contracts in a single aggregate3 eth_call, tolerating failures.
+
+    Args:
+        w3: AsyncWeb3 instance for the network
+        network: The network name
+        calls: List of (contract, function name, args, output type) tuples
+
+    Returns:
+        List of decoded return values in call order, None where a call
+        reverted or returned nothing decodable
+    """
+    results = await aggregate3(w3, network, [
+        (contract.address, HexBytes(contract.encode_abi(fn_name, args=args)))
+        for contract, fn_name, args, _ in calls
+    ])
+
+    values = []
+    for (_, _, _, output_type), (success, data) in zip(calls, results):
+        value = None
+        if success:
+            try:
+                value = w3.codec.decode([output_type], data)[0]
+            except DecodingError:
+                pass
+        values.append(value)
+    return values
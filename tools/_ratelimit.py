@@ -0,0 +1,73 @@
+"""
+Adaptive Rate Limiting
+
+Token bucket that smooths request bursts to the configured per-minute quota
+and adapts its refill rate to provider throttling (AIMD): the rate halves on
+HTTP 429 and recovers additively on every successful response.
+"""
+
+import asyncio
+import time
+
+# Multiplicative decrease applied on HTTP 429
+DECREASE_FACTOR = 0.5
+
+# Additive increase (tokens/second) applied on every successful response
+INCREASE_STEP = 0.1
+
+# Floor for the refill rate (tokens/second) so a throttled chain still makes progress
+MIN_RATE = 1.0
+
+
+class AdaptiveTokenBucket:
+    """
+    Token bucket with an AIMD-adjusted refill rate.
+
+    Args:
+        capacity: Maximum number of tokens (burst size)
+        rate: Nominal refill rate in tokens per second
+    """
+
+    def __init__(self, capacity, rate):
+        self.capacity = capacity
+        self.max_rate = rate
+        self.rate = rate
+        self.tokens = capacity
+        self.last = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+
+    async def acquire(self):
+        """Take one token, sleeping until one is available"""
+        while True:
+            self._refill()
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def on_throttled(self):
+        """Back off after the provider answered HTTP 429"""
+        self.rate = min(self.max_rate, max(MIN_RATE, self.rate * DECREASE_FACTOR))
+
+    def on_success(self):
+        """Recover towards the nominal rate after a successful response"""
+        self.rate = min(self.max_rate, self.rate + INCREASE_STEP)
+
+
+def build_buckets(networks, max_requests_per_minute):
+    """
+    Create one independent bucket per network.
+
+    Args:
+        networks: Iterable of network names
+        max_requests_per_minute: Quota from config.limits
+
+    Returns:
+        Dictionary mapping network name to its AdaptiveTokenBucket
+    """
+    rate = max_requests_per_minute / 60
+    return {network: AdaptiveTokenBucket(max_requests_per_minute, rate) for network in networks}
@@ -0,0 +1,331 @@
+"""
+Batched JSON-RPC Client
+
+Shared aiohttp transport for all tools. Requests issued concurrently against
+the same network are buffered for a few milliseconds and flushed as a single
+JSON-RPC batch (one HTTP POST carrying an array of requests). Batches made
+only of read methods are raced against the network's mirrors.
+"""
+
+import asyncio
+import functools
+import itertools
+
+import aiohttp
+import orjson
+from web3 import AsyncWeb3
+from web3.providers.async_base import AsyncJSONBaseProvider
+
+from config import config
+from tools._circuit import ProviderUnavailable, build_circuits
+from tools._ratelimit import build_buckets
+from tools._rpc_cache import FROM_MIRROR, cached_rpc
+from tools._rpc_templates import encode_request
+
+# How long requests wait for company before a batch is flushed (seconds)
+BATCH_WINDOW = 0.005
+
+# Flush immediately once this many requests are queued for one network
+MAX_BATCH_SIZE = 100
+
+# Seconds an idle keep-alive connection stays in the pool
+KEEPALIVE_TIMEOUT = 75
+
+# Seconds resolved provider addresses are reused before resolving again
+DNS_CACHE_TTL = 300
+
+# Head start given to each address family before racing the next (RFC 8305)
+HAPPY_EYEBALLS_DELAY = 0.1
+
+# Resends of a read-only batch when the host dropped a pooled keep-alive connection
+STALE_CONNECTION_RETRIES = 1
+
+# Idempotent reads that may be raced against mirrors - never writes or filters
+READ_METHODS = frozenset({
+    "eth_call",
+    "eth_getBalance",
+    "eth_getCode",
+    "eth_getStorageAt",
+    "eth_getLogs",
+    "eth_blockNumber",
+    "eth_getBlockByNumber",
+    "eth_getTransactionByHash",
+    "eth_getTransactionReceipt",
+})
+
+
+class BatchRpcClient:
+    """
+    Coalesce concurrent JSON-RPC calls into array batches per network.
+
+    Every call is queued with a future; the first request queued for a network
+    schedules a flush after BATCH_WINDOW, and everything queued by then goes
+    out in the same HTTP POST.
+    """
+
+    def __init__(self, networks, mirrors=None, batch_window=BATCH_WINDOW, max_batch_size=MAX_BATCH_SIZE):
+        self.networks = networks
+        self.mirrors = mirrors or {}
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self._ids = itertools.count(1)
+        self._pending = {}
+        self._flush_handles = {}
+        self._inflight = set()
+        self._session = None
+        self._loop = None
+        self._buckets = build_buckets(networks, config.limits.max_requests_per_minute)
+        self._circuits = build_circuits(
+            url for network in networks for url in self._endpoints(network, read_only=True)
+        )
+
+    def _get_session(self):
+        """Return the pooled session, recreating it if the event loop changed"""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            limits = config.limits
+            # Pool per provider host so one slow chain can't hold every socket;
+            # aiohttp already sets TCP_NODELAY on every connection it opens
+            connector = aiohttp.TCPConnector(
+                limit=limits.max_concurrent_requests * len(self._circuits),
+                limit_per_host=limits.max_concurrent_requests,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=DNS_CACHE_TTL,
+                happy_eyeballs_delay=HAPPY_EYEBALLS_DELAY
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=limits.request_timeout)
+            )
+            self._loop = loop
+        return self._session
+
+    def _endpoints(self, network, read_only):
+        """Primary RPC URL for a network, followed by its mirrors for read-only traffic"""
+        _, rpc_url = self.networks[network]
+        if read_only:
+            return (rpc_url, *self.mirrors.get(network, ()))
+        return (rpc_url,)
+
+    def next_id(self):
+        """Allocate a JSON-RPC request id"""
+        return next(self._ids)
+
+    @cached_rpc
+    async def request(self, network, method, params):
+        """
+        Queue a JSON-RPC request and wait for its response.
+
+        Args:
+            network: The network to send the request to (mainnet, sepolia, etc.)
+            method: The JSON-RPC method name
+            params: The JSON-RPC params list
+
+        Returns:
+            The raw JSON-RPC response dictionary (with "result" or "error")
+        """
+        if network not in self.networks:
+            raise ValueError(f"Network {network} not supported")
+
+        # The chain id is static per network - answer from config instead of the provider
+        if method == "eth_chainId":
+            chain_id, _ = self.networks[network]
+            return {"jsonrpc": "2.0", "id": self.next_id(), "result": hex(chain_id)}
+
+        # Fail fast instead of queueing behind providers that keep failing
+        if not any(self._circuits[url].allow() for url in self._endpoints(network, method in READ_METHODS)):
+            raise ProviderUnavailable(f"All RPC endpoints for {network} are unavailable")
+
+        loop = asyncio.get_running_loop()
+
+        # Allocate the id before waiting on the rate limiter so batch ids stay in call order
+        rpc_request = {
+            "jsonrpc": "2.0",
+            "id": self.next_id(),
+            "method": method,
+            "params": params or []
+        }
+
+        await self._buckets[network].acquire()
+
+        future = loop.create_future()
+        pending = self._pending.setdefault(network, [])
+        pending.append((rpc_request, future))
+
+        if len(pending) >= self.max_batch_size:
+            self._flush(network)
+        elif len(pending) == 1:
+            self._flush_handles[network] = loop.call_later(self.batch_window, self._flush, network)
+
+        return await future
+
+    def _flush(self, network):
+        """Send everything queued for a network as one batch"""
+        handle = self._flush_handles.pop(network, None)
+        if handle:
+            handle.cancel()
+
+        batch = self._pending.pop(network, None)
+        if not batch:
+            return
+
+        # Keep a reference so the task isn't garbage collected mid-flight
+        task = asyncio.ensure_future(self._send(network, batch))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _send(self, network, batch):
+        """POST a batch and resolve each queued future with its response"""
+        # A lone request goes out as a plain object - some providers reject batches of one
+        if len(batch) == 1:
+            body = encode_request(batch[0][0])
+        else:
+            body = b"[" + b",".join(encode_request(req) for req, _ in batch) + b"]"
+
+        read_only = all(rpc_request["method"] in READ_METHODS for rpc_request, _ in batch)
+        urls = [url for url in self._endpoints(network, read_only) if self._circuits[url].allow()]
+        # Only reads are safe to resend after a dropped connection
+        retries = STALE_CONNECTION_RETRIES if read_only else 0
+        try:
+            if not urls:
+                raise ProviderUnavailable(f"All RPC endpoints for {network} are unavailable")
+            if len(urls) == 1:
+                url, payload = urls[0], await self._post(network, urls[0], body, retries)
+            else:
+                url, payload = await self._race(network, urls, body, retries)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        # Providers answer a batch with a single error object when they reject it outright
+        if isinstance(payload, dict):
+            payload = [payload] if len(batch) == 1 else [{**payload, "id": req["id"]} for req, _ in batch]
+
+        # Tag mirror answers so the response cache keeps them off disk
+        if url != self.networks[network][1]:
+            payload = [{**item, FROM_MIRROR: True} for item in payload]
+
+        responses = {item.get("id"): item for item in payload}
+        for rpc_request, future in batch:
+            if future.done():
+                continue
+            response = responses.get(rpc_request["id"])
+            if response is None:
+                future.set_exception(ConnectionError(f"No response for {rpc_request['method']} in batch from {network}"))
+            else:
+                future.set_result(response)
+
+    async def _post(self, network, url, body, retries=0):
+        """
+        POST one body to one endpoint, feeding its circuit and the network's rate limiter.
+
+        If the host closed the pooled keep-alive connection before the request
+        went through, the body is resent on a fresh connection up to retries times.
+        """
+        primary = url == self.networks[network][1]
+        bucket = self._buckets[network]
+        circuit = self._circuits[url]
+        while True:
+            try:
+                session = self._get_session()
+                async with session.post(
+                    url,
+                    data=body,
+                    headers={"Content-Type": "application/json"}
+                ) as response:
+                    if response.status == 429 and primary:
+                        bucket.on_throttled()
+                    response.raise_for_status()
+                    payload = orjson.loads(await response.read())
+                break
+            except aiohttp.ServerDisconnectedError:
+                if retries > 0:
+                    retries -= 1
+                    continue
+                circuit.on_failure()
+                raise
+            except Exception:
+                circuit.on_failure()
+                raise
+
+        if primary:
+            bucket.on_success()
+        circuit.on_success()
+        return payload
+
+    async def _race(self, network, urls, body, retries=0):
+        """
+        POST a read-only batch to every endpoint and keep the first clean answer.
+
+        A payload carrying JSON-RPC errors (e.g. a pruned mirror missing state)
+        or null results (e.g. a lagging mirror that hasn't seen a transaction)
+        only wins if no endpoint answers cleanly; the losers are cancelled.
+
+        Returns:
+            Tuple of (winning endpoint URL, response payload)
+        """
+        tasks = {asyncio.ensure_future(self._post(network, url, body, retries)): url for url in urls}
+        pending = set(tasks)
+        fallback = None
+        error = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        error = error or task.exception()
+                        continue
+                    payload = task.result()
+                    items = payload if isinstance(payload, list) else [payload]
+                    if not any("error" in item or item.get("result") is None for item in items):
+                        return tasks[task], payload
+                    fallback = fallback or (tasks[task], payload)
+        finally:
+            for task in pending:
+                task.cancel()
+
+        if fallback is not None:
+            return fallback
+        raise error
+
+    async def close(self):
+        """Close the pooled HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+class BatchRpcProvider(AsyncJSONBaseProvider):
+    """AsyncWeb3 provider that routes every request through the shared batch client"""
+
+    def __init__(self, network, client=None, **kwargs):
+        super().__init__(**kwargs)
+        self.network = network
+        self.client = client or rpc_client
+
+    def __str__(self):
+        return f"BatchRpcProvider({self.network})"
+
+    async def make_request(self, method, params):
+        return await self.client.request(self.network, method, params)
+
+    async def make_batch_request(self, requests):
+        return list(await asyncio.gather(*(self.make_request(method, params) for method, params in requests)))
+
+
+# Shared client used by every tool
+rpc_client = BatchRpcClient(config.networks, config.rpc_mirrors)
+
+
+@functools.cache
+def get_w3(network):
+    """
+    Shared AsyncWeb3 instance for a network, built on first use.
+
+    Every instance routes through rpc_client, so there is nothing to connect
+    per call and no connectivity probe - a down provider fails the first real
+    request instead.
+    """
+    return AsyncWeb3(BatchRpcProvider(network))
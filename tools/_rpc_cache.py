@@ -0,0 +1,283 @@
+"""
+RPC Response Cache
+
+Two-level cache (in-memory LRU in front of an on-disk SQLite store) for
+JSON-RPC responses that can never change: calls pinned to a block and
+transactions and receipts mined in one, once that block is past the reorg
+window, plus deployed contract bytecode (but not EIP-7702 delegations).
+"""
+
+import contextvars
+import functools
+import hashlib
+import sqlite3
+from collections import OrderedDict
+from pathlib import Path
+
+import orjson
+
+from config import config
+from tools._rpc_templates import json_default
+
+CACHE_PATH = Path.home() / ".evm-mcp" / "rpc.sqlite3"
+
+# Block tags whose meaning moves with the chain head
+BLOCK_TAGS = frozenset({"latest", "pending", "safe", "finalized"})
+
+# Methods keyed by a hash - the answer is fixed once it is mined
+HASH_KEYED_METHODS = frozenset({
+    "eth_getTransactionByHash",
+    "eth_getTransactionReceipt",
+    "eth_getBlockByHash",
+})
+
+# Methods that are immutable when pinned to a block number, by block param position
+BLOCK_PARAM_INDEX = {
+    "eth_call": 1,
+    "eth_getBalance": 1,
+    "eth_getStorageAt": 2,
+    "eth_getTransactionCount": 1,
+    "eth_getBlockByNumber": 0,
+}
+
+# EIP-7702 delegation designator: an EOA's "code" that its owner can re-delegate or clear
+DELEGATION_PREFIX = "0xef0100"
+
+# Blocks a number-pinned answer must trail the highest head seen before it is
+# cached; anything newer can still be replaced by a reorg
+FINALITY_MARGIN = 128
+
+# Highest block number seen per network, learned from responses passing through
+chain_heads = {}
+
+# True while a caller wants fresh answers: cache lookups are skipped for RPC calls
+# made in that context, and what comes back still refreshes the cache
+bypass_lookup = contextvars.ContextVar("bypass_rpc_cache_lookup", default=False)
+
+# Set by the client on responses a mirror answered; they are never written to disk
+FROM_MIRROR = "_from_mirror"
+
+
+class LRUCache:
+    """Small ordered-dict LRU for hot keys"""
+
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+
+    def get(self, key):
+        try:
+            self._data.move_to_end(key)
+        except KeyError:
+            return None
+        return self._data[key]
+
+    def set(self, key, value):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+
+class DiskCache:
+    """SQLite-backed key/value store, opened lazily on first use"""
+
+    def __init__(self, path=CACHE_PATH):
+        self.path = path
+        self._conn = None
+        self._disabled = False
+
+    def _connect(self):
+        if self._conn is None and not self._disabled:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute("CREATE TABLE IF NOT EXISTS rpc_cache (key TEXT PRIMARY KEY, value BLOB)")
+            except (OSError, sqlite3.Error):
+                # Read-only home or locked database - run with the memory layer only
+                self._conn = None
+                self._disabled = True
+        return self._conn
+
+    def get(self, key):
+        conn = self._connect()
+        if conn is None:
+            return None
+        try:
+            row = conn.execute("SELECT value FROM rpc_cache WHERE key = ?", (key,)).fetchone()
+        except sqlite3.Error:
+            return None
+        return row[0] if row else None
+
+    def set(self, key, value):
+        conn = self._connect()
+        if conn is None:
+            return
+        try:
+            conn.execute("INSERT OR REPLACE INTO rpc_cache (key, value) VALUES (?, ?)", (key, value))
+        except sqlite3.Error:
+            pass
+
+
+memory_cache = LRUCache()
+disk_cache = DiskCache()
+
+
+def _canonical_params(params):
+    """Serialize params deterministically so equal requests share a key"""
+    return orjson.dumps(params, default=json_default, option=orjson.OPT_SORT_KEYS).lower()
+
+
+def _is_block_pinned(block):
+    """True when a block identifier refers to one fixed block"""
+    if block is None:
+        return False
+    if isinstance(block, str):
+        return block not in BLOCK_TAGS
+    return True
+
+
+def _block_number(block):
+    """Block number of a block identifier, or None if it is not a number"""
+    if block == "earliest":
+        return 0
+    if isinstance(block, str):
+        try:
+            return int(block, 16)
+        except ValueError:
+            return None
+    return block if isinstance(block, int) else None
+
+
+def _note_head(network, method, result):
+    """Raise the known chain head from responses that reveal it"""
+    if method == "eth_blockNumber":
+        number = _block_number(result)
+    elif method == "eth_getBlockByNumber" and isinstance(result, dict):
+        number = _block_number(result.get("number"))
+    else:
+        return
+    if number is not None and number > chain_heads.get(network, -1):
+        chain_heads[network] = number
+
+
+def _is_settled(network, method, params, result):
+    """
+    True when a successful answer to a cacheable request can no longer change.
+
+    Blocks fetched by hash must be sealed. Answers pinned to a block number, and
+    transactions and receipts by the block they were mined in, must trail the
+    highest head seen by at least FINALITY_MARGIN blocks; with no head seen yet
+    they are not cached.
+
+    Args:
+        network: The network the request targeted
+        method: The JSON-RPC method name
+        params: The JSON-RPC params list
+        result: The non-null JSON-RPC result
+
+    Returns:
+        True if the result may be cached
+    """
+    if method == "eth_getBlockByHash":
+        return result.get("hash") is not None
+    if method == "eth_getCode":
+        # Empty code: the address may still receive a deployment.
+        # A delegation designator can be replaced or cleared at any time.
+        return result not in ("0x", "") and not result.lower().startswith(DELEGATION_PREFIX)
+
+    if method in ("eth_getTransactionByHash", "eth_getTransactionReceipt"):
+        # A pending transaction comes back with a null block; a freshly mined
+        # one can still be reorged into another block or dropped
+        if result.get("blockHash") is None:
+            return False
+        block = result.get("blockNumber")
+    elif method == "eth_getLogs":
+        log_filter = params[0]
+        if "blockHash" in log_filter:
+            return True
+        block = log_filter.get("toBlock")
+    else:
+        block = params[BLOCK_PARAM_INDEX[method]]
+
+    number = _block_number(block)
+    head = chain_heads.get(network)
+    return number is not None and head is not None and number <= head - FINALITY_MARGIN
+
+
+def cache_key(network, method, params):
+    """
+    Build the cache key for a request, or None if the answer may change.
+
+    Args:
+        network: The network the request targets
+        method: The JSON-RPC method name
+        params: The JSON-RPC params list
+
+    Returns:
+        Hex digest key, or None when the request is not cacheable
+    """
+    params = params or []
+
+    if method in HASH_KEYED_METHODS or method == "eth_getCode":
+        pass
+    elif method in BLOCK_PARAM_INDEX:
+        index = BLOCK_PARAM_INDEX[method]
+        if len(params) <= index or not _is_block_pinned(params[index]):
+            return None
+    elif method == "eth_getLogs":
+        log_filter = params[0] if params else {}
+        if "blockHash" not in log_filter and not (
+            _is_block_pinned(log_filter.get("fromBlock")) and _is_block_pinned(log_filter.get("toBlock"))
+        ):
+            return None
+    else:
+        return None
+
+    chain_id, _ = config.networks.get(network, (network, None))
+    digest = hashlib.blake2b(digest_size=32)
+    digest.update(f"{chain_id}|{method}|".encode())
+    digest.update(_canonical_params(params))
+    return digest.hexdigest()
+
+
+def cached_rpc(request):
+    """
+    Decorate BatchRpcClient.request with the two-level response cache.
+
+    Only successful, non-null results that _is_settled accepts are stored.
+    eth_getCode is cached even at "latest" since contract code, once deployed,
+    does not change; EIP-7702 delegation designators (0xef0100...) are not
+    contract code and are never cached. Answers won by a mirror stay in memory only, so a lagging
+    mirror can't leave a stale answer on disk. Every response also feeds the
+    known chain head.
+    """
+    @functools.wraps(request)
+    async def wrapper(client, network, method, params):
+        key = cache_key(network, method, params)
+        if key is not None and not bypass_lookup.get():
+            # Both layers hold the serialized result so callers never share a mutable object
+            stored = memory_cache.get(key)
+            if stored is None:
+                stored = disk_cache.get(key)
+                if stored is not None:
+                    memory_cache.set(key, stored)
+
+            if stored is not None:
+                return {"jsonrpc": "2.0", "id": client.next_id(), "result": orjson.loads(stored)}
+
+        response = await request(client, network, method, params)
+        from_mirror = response.pop(FROM_MIRROR, False)
+
+        result = response.get("result")
+        _note_head(network, method, result)
+        if key is not None and "error" not in response and result is not None and _is_settled(network, method, params or [], result):
+            stored = orjson.dumps(result)
+            memory_cache.set(key, stored)
+            if not from_mirror:
+                disk_cache.set(key, stored)
+
+        return response
+
+    return wrapper
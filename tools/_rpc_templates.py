@@ -0,0 +1,88 @@
+"""
+JSON-RPC Request Templates
+
+Pre-serialized request bodies for the fixed-shape methods the tools issue
+most. Each template is built once at import and filled with %-substitution,
+skipping the generic JSON encoder for the common case.
+"""
+
+import re
+
+import orjson
+from hexbytes import HexBytes
+from pydantic import BaseModel
+from web3.datastructures import AttributeDict
+
+# Values safe to splice into a template verbatim: hex quantities/data and block tags
+_SAFE_PARAM = re.compile(rb"0x[0-9a-fA-F]*|latest|pending|safe|finalized|earliest")
+
+GET_BALANCE_TMPL = b'{"jsonrpc":"2.0","id":%d,"method":"eth_getBalance","params":["%s","%s"]}'
+GET_CODE_TMPL = b'{"jsonrpc":"2.0","id":%d,"method":"eth_getCode","params":["%s","%s"]}'
+GET_BLOCK_BY_NUMBER_TMPL = b'{"jsonrpc":"2.0","id":%d,"method":"eth_getBlockByNumber","params":["%s",%s]}'
+GET_TX_BY_HASH_TMPL = b'{"jsonrpc":"2.0","id":%d,"method":"eth_getTransactionByHash","params":["%s"]}'
+GET_TX_RECEIPT_TMPL = b'{"jsonrpc":"2.0","id":%d,"method":"eth_getTransactionReceipt","params":["%s"]}'
+CHAIN_ID_TMPL = b'{"jsonrpc":"2.0","id":%d,"method":"eth_chainId","params":[]}'
+BLOCK_NUMBER_TMPL = b'{"jsonrpc":"2.0","id":%d,"method":"eth_blockNumber","params":[]}'
+
+# Methods whose params are all plain strings, keyed to (template, param count)
+_STRING_PARAM_TEMPLATES = {
+    "eth_getBalance": (GET_BALANCE_TMPL, 2),
+    "eth_getCode": (GET_CODE_TMPL, 2),
+    "eth_getTransactionByHash": (GET_TX_BY_HASH_TMPL, 1),
+    "eth_getTransactionReceipt": (GET_TX_RECEIPT_TMPL, 1),
+    "eth_chainId": (CHAIN_ID_TMPL, 0),
+    "eth_blockNumber": (BLOCK_NUMBER_TMPL, 0),
+}
+
+
+def json_default(obj):
+    """orjson fallback for the web3 types Web3JsonEncoder understands"""
+    if isinstance(obj, AttributeDict):
+        return dict(obj)
+    if isinstance(obj, (HexBytes, bytes)):
+        return "0x" + obj.hex().removeprefix("0x")
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(by_alias=True)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _safe_bytes(value):
+    """Return value as ASCII bytes if it can be spliced verbatim, else None"""
+    if not isinstance(value, str):
+        return None
+    try:
+        encoded = value.encode("ascii")
+    except UnicodeEncodeError:
+        return None
+    return encoded if _SAFE_PARAM.fullmatch(encoded) else None
+
+
+def encode_request(rpc_request):
+    """
+    Encode one JSON-RPC request dict to bytes.
+
+    Uses a pre-serialized template when the method and params fit one,
+    otherwise falls back to orjson.
+
+    Args:
+        rpc_request: Dictionary with jsonrpc, id, method and params
+
+    Returns:
+        The request body as bytes
+    """
+    method = rpc_request["method"]
+    params = rpc_request["params"]
+    request_id = rpc_request["id"]
+
+    if isinstance(request_id, int):
+        template = _STRING_PARAM_TEMPLATES.get(method)
+        if template is not None and len(params) == template[1]:
+            values = [_safe_bytes(param) for param in params]
+            if None not in values:
+                return template[0] % (request_id, *values)
+        elif method == "eth_getBlockByNumber" and len(params) == 2 and isinstance(params[1], bool):
+            block = _safe_bytes(params[0])
+            if block is not None:
+                return GET_BLOCK_BY_NUMBER_TMPL % (request_id, block, b"true" if params[1] else b"false")
+
+    return orjson.dumps(rpc_request, default=json_default)
@@ -0,0 +1,60 @@
+"""
+Token Metadata Cache
+
+A token's name, symbol and decimals are fixed once it is deployed, so they
+are read from the chain once per (chain id, token address) and served from
+memory afterwards. Mutable values such as totalSupply are never cached here.
+"""
+
+from config import config
+from tools._rpc_cache import LRUCache
+
+# (chain id, lowercase token address) -> dict of the metadata fields read so far
+token_cache = LRUCache(maxsize=4096)
+
+
+def _key(network, token_address):
+    chain_id, _ = config.networks[network]
+    return chain_id, token_address.lower()
+
+
+def cached_token_fields(network, token_address, fields):
+    """
+    Look up immutable token metadata.
+
+    Args:
+        network: The network the token lives on
+        token_address: The token contract address
+        fields: Field names wanted, e.g. ("name", "symbol", "decimals")
+
+    Returns:
+        Tuple of the values in fields order, or None unless all are cached
+    """
+    known = token_cache.get(_key(network, token_address))
+    if known is None or not all(field in known for field in fields):
+        return None
+    return tuple(known[field] for field in fields)
+
+
+def remember_token_fields(network, token_address, **values):
+    """Store metadata fields read from the chain for a token"""
+    key = _key(network, token_address)
+    known = token_cache.get(key)
+    token_cache.set(key, {**(known or {}), **values})
+
+
+def format_units(amount, decimals):
+    """
+    Render an integer token amount in whole units without going through float.
+
+    Args:
+        amount: Raw integer amount in the token's smallest unit
+        decimals: The token's decimals
+
+    Returns:
+        Exact decimal string with trailing zeros dropped, e.g. "1.5" or "42"
+    """
+    if not decimals:
+        return str(amount)
+    whole, fraction = divmod(amount, 10 ** decimals)
+    return f"{whole}.{fraction:0{decimals}d}".rstrip('0').rstrip('.')
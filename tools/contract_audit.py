@@ -6,18 +6,185 @@ security analysis, standards detection, and contract metadata.
 Supports 12+ blockchain networks with fallback mechanisms.
 """
 
-import requests
-import json
-from web3 import Web3
+import asyncio
+import hashlib
+import logging
+import re
+import time
+import aiohttp
+import orjson
 from config import config
-from tools.token_metadata import token_metadata_tool
+from eth_abi.exceptions import DecodingError
+from eth_utils import is_address, to_checksum_address
+from tools._multicall import aggregate3, eth_balance_call
+from tools._rpc import DNS_CACHE_TTL, KEEPALIVE_TIMEOUT, get_w3
+from tools._rpc_cache import LRUCache, bypass_lookup
+from tools._tokens import format_units
 from prompts.contract_audit import (
-    contract_security_audit_prompt,
-    contract_quick_analysis_prompt,
-    contract_deep_dive_prompt
+    SECURITY_AUDIT_TEMPLATE,
+    QUICK_ANALYSIS_TEMPLATE,
+    DEEP_DIVE_TEMPLATE
 )
 
-async def contract_audit_tool(address: str, network: str = "mainnet", format: str = "raw") -> dict:
+# Logged rather than printed - stdout carries the MCP stdio transport
+log = logging.getLogger(__name__)
+
+# Pre-parsed prompt template for each non-raw output format
+AUDIT_TEMPLATES = {
+    "audit": SECURITY_AUDIT_TEMPLATE,
+    "quick": QUICK_ANALYSIS_TEMPLATE,
+    "deep": DEEP_DIVE_TEMPLATE,
+}
+
+# Read-only calls probed by analyze_deployed_state: (key, selector, output type)
+DEPLOYED_STATE_CALLS = (
+    ("name", bytes.fromhex("06fdde03"), "string"),
+    ("symbol", bytes.fromhex("95d89b41"), "string"),
+    ("decimals", bytes.fromhex("313ce567"), "uint8"),
+    ("total_supply", bytes.fromhex("18160ddd"), "uint256"),
+    ("owner", bytes.fromhex("8da5cb5b"), "address"),
+)
+
+# Function names an ABI must expose to match each token standard
+ERC20_FUNCTIONS = frozenset({'totalSupply', 'balanceOf', 'transfer', 'transferFrom', 'approve', 'allowance'})
+ERC721_FUNCTIONS = frozenset({'balanceOf', 'ownerOf', 'safeTransferFrom', 'transferFrom', 'approve', 'getApproved', 'setApprovalForAll', 'isApprovedForAll'})
+ERC1155_FUNCTIONS = frozenset({'balanceOf', 'balanceOfBatch', 'setApprovalForAll', 'isApprovedForAll', 'safeTransferFrom', 'safeBatchTransferFrom'})
+
+# Bytecode patterns that mark proxy contracts
+PROXY_PATTERNS = {
+    "360894a13ba1a3210667c828492db98dca3e2076cc3735a920a3ca505d382bbc": "OpenZeppelin Transparent Proxy",
+    "5c60da1b": "EIP-1967 Proxy",
+    "f851a440": "EIP-1822 Universal Proxy",
+    "4e487b71": "OpenZeppelin Upgradeable",
+    "a3f0ad74e8653cd": "Beacon Proxy"
+}
+
+# Storage slots holding a proxy's implementation address, in order of preference
+IMPLEMENTATION_SLOTS = (
+    0x360894a13ba1a3210667c828492db98dca3e2076cc3735a920a3ca505d382bbc,  # EIP-1967
+    0x7050c9e0f4ca769c69bd3a8ef740bc37934f8e2c036e5a4fd6e3cd362f230da,  # Alternative slot
+)
+
+# EIP-1967 admin and beacon slots
+EIP1967_ADMIN_SLOT = 0xb53127684a568b3173ae13b9f8a6016e243e63b6e8ee1178d6a717850b5d6103
+EIP1967_BEACON_SLOT = 0xa3f0ad74e5423aebfd80d3ef4346578335a9a72aeaee59ff6cb3582b35133d50
+
+# Every slot probe_proxy reads: implementation slots, then admin, then beacon
+PROXY_SLOTS = (*IMPLEMENTATION_SLOTS, EIP1967_ADMIN_SLOT, EIP1967_BEACON_SLOT)
+
+# Common function selectors / event topics and their meanings
+BYTECODE_FUNCTION_SELECTORS = {
+    "06fdde03": "name()",
+    "95d89b41": "symbol()", 
+    "18160ddd": "totalSupply()",
+    "70a08231": "balanceOf(address)",
+    "a9059cbb": "transfer(address,uint256)",
+    "23b872dd": "transferFrom(address,address,uint256)",
+    "095ea7b3": "approve(address,uint256)",
+    "8c5be1e5ebec7d5bd14f71427d1e84f3dd0314c0f7b2291e5b200ac8c7c3b925": "Approval(address,address,uint256)",
+    "ddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef": "Transfer(address,address,uint256)",
+    "01ffc9a7": "supportsInterface(bytes4)",
+    "6352211e": "ownerOf(uint256)",
+    "42842e0e": "safeTransferFrom(address,address,uint256)",
+    "b88d4fde": "safeTransferFrom(address,address,uint256,bytes)"
+}
+
+# Every hex pattern the bytecode helpers look for - Solidity preamble and Uniswap V2 router included
+BYTECODE_PATTERNS = frozenset({*PROXY_PATTERNS, *BYTECODE_FUNCTION_SELECTORS, "6080604052", "e8a3d485"})
+
+
+def _byte_pattern(pattern):
+    """Compile a hex pattern to a bytes regex; an odd trailing nibble is the high half of the next byte"""
+    whole, nibble = divmod(len(pattern), 2)
+    regex = re.escape(bytes.fromhex(pattern[:whole * 2]))
+    if nibble:
+        high = int(pattern[-1], 16) << 4
+        regex += b"[\\x%02x-\\x%02x]" % (high, high | 0x0f)
+    return re.compile(regex)
+
+
+# BYTECODE_PATTERNS matched against the raw code bytes, keyed by their hex form
+BYTECODE_PATTERN_BYTES = {pattern: _byte_pattern(pattern) for pattern in BYTECODE_PATTERNS}
+
+# Pattern scans keyed by a 16-byte bytecode fingerprint -> frozenset of patterns
+_pattern_cache = LRUCache(maxsize=8192)
+
+# Every source pattern analyze_contract_security looks for, matched in one pass
+SECURITY_PATTERNS = re.compile(
+    r"(?P<reentrancy>call\.value)"
+    r"|(?P<guard>ReentrancyGuard)"
+    r"|(?P<tx_origin>tx\.origin)"
+    r"|(?P<external_call>\.(?:delegate)?call\()"
+    r"|(?P<timestamp>block\.timestamp|now)"
+    r"|(?P<selfdestruct>selfdestruct|suicide)"
+)
+
+# A line that both requires and makes a low-level call
+CHECKED_CALL = re.compile(r"require[^\n]*\.call|\.call[^\n]*require")
+
+# Timeout for a single Etherscan API request
+ETHERSCAN_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+# Concurrent connections kept open to the Etherscan API host
+ETHERSCAN_CONNECTIONS = 16
+
+# Seconds an unverified status is trusted - a contract may be verified later.
+# Creation info and verified source never change and do not expire.
+VERIFICATION_TTL = 3600
+
+_etherscan_session = None
+_etherscan_loop = None
+
+# Etherscan lookups keyed by (chain id, action, lowercase address) -> (expires_at, result)
+_etherscan_cache = LRUCache(maxsize=4096)
+
+
+def get_etherscan_session():
+    """
+    Return the pooled aiohttp session used for Etherscan requests.
+    
+    Connections are kept alive between audits so only the first lookup pays
+    the TCP/TLS handshake; the session is recreated if the event loop changed.
+    """
+    global _etherscan_session, _etherscan_loop
+    loop = asyncio.get_running_loop()
+    if _etherscan_session is None or _etherscan_session.closed or _etherscan_loop is not loop:
+        connector = aiohttp.TCPConnector(
+            limit=ETHERSCAN_CONNECTIONS,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=DNS_CACHE_TTL
+        )
+        _etherscan_session = aiohttp.ClientSession(connector=connector, timeout=ETHERSCAN_TIMEOUT)
+        _etherscan_loop = loop
+    return _etherscan_session
+
+
+def _cached_lookup(key):
+    """Return a copy of a cached Etherscan result, or None if missing or expired"""
+    entry = _etherscan_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, value = entry
+    if expires_at is not None and time.monotonic() >= expires_at:
+        return None
+    return dict(value)
+
+
+def _store_lookup(key, value, ttl=None):
+    """Cache an Etherscan result, forever unless a ttl in seconds is given"""
+    expires_at = None if ttl is None else time.monotonic() + ttl
+    _etherscan_cache.set(key, (expires_at, dict(value)))
+
+
+async def close_etherscan_session():
+    """Close the Etherscan session on shutdown"""
+    global _etherscan_session
+    if _etherscan_session is not None and not _etherscan_session.closed:
+        await _etherscan_session.close()
+    _etherscan_session = None
+
+
+async def contract_audit_tool(address: str, network: str = "mainnet", format: str = "raw", bypass_cache: bool = False) -> dict:
     """
     Comprehensive contract audit and analysis across multiple blockchain networks.
     
@@ -27,6 +194,8 @@ async def contract_audit_tool(address: str, network: str = "mainnet", format: st
                  All networks from config.rpc_urls are supported
         format: Output format → "raw" (data only), "audit" (security audit prompt), 
                 "quick" (quick analysis prompt), "deep" (deep dive prompt)
+        bypass_cache: Fetch everything fresh - cached Etherscan creation and verification
+                      data and cached RPC answers such as the bytecode are not reused
     
     Returns:
         Dictionary containing comprehensive contract analysis
@@ -36,25 +205,24 @@ async def contract_audit_tool(address: str, network: str = "mainnet", format: st
     """
     try:
         # Validate network support
-        if network not in config["rpc_urls"]:
-            supported_networks = list(config["rpc_urls"].keys())
-            raise ValueError(f"Network '{network}' not supported. Supported networks: {supported_networks}")
+        network = config.resolve_network(network)
         
-        # Create Web3 instance
-        w3 = Web3(Web3.HTTPProvider(config["rpc_urls"][network]))
-        
-        # Check if connected
-        if not w3.is_connected():
-            raise ConnectionError(f"Failed to connect to {network} network")
-        
-        # Validate and format address
-        if not w3.is_address(address):
+        # Validate and format address before touching the provider
+        if not is_address(address):
             raise ValueError("Invalid Ethereum address format")
         
-        formatted_address = w3.to_checksum_address(address)
+        formatted_address = to_checksum_address(address)
         
-        # Perform comprehensive analysis
-        result = await analyze_contract(w3, formatted_address, network)
+        # Shared Web3 instance; connection problems surface from the first real call
+        w3 = get_w3(network)
+        
+        # Perform comprehensive analysis; RPC calls made under it skip cache lookups
+        # when bypassing (tasks spawned by gather inherit the setting)
+        token = bypass_lookup.set(bypass_cache)
+        try:
+            result = await analyze_contract(w3, formatted_address, network, bypass_cache)
+        finally:
+            bypass_lookup.reset(token)
         
         # Format output based on requested format
         if format == "raw":
@@ -70,11 +238,11 @@ async def contract_audit_tool(address: str, network: str = "mainnet", format: st
         }
 
 
-async def analyze_contract(w3, address, network):
+async def analyze_contract(w3, address, network, bypass_cache=False):
     """Perform comprehensive contract analysis with multi-chain support"""
     
     # Step 1: Check if address is a contract
-    is_contract = await check_if_contract(w3, address)
+    is_contract, bytecode = await check_if_contract(w3, address)
     
     result = {
         "address": address,
@@ -102,36 +270,46 @@ async def analyze_contract(w3, address, network):
         
         # Get native token balance and transaction count
         try:
-            balance = w3.eth.get_balance(address)
+            balance, transaction_count = await asyncio.gather(
+                w3.eth.get_balance(address),
+                w3.eth.get_transaction_count(address)
+            )
             result["native_balance"] = str(w3.from_wei(balance, 'ether'))
-            result["transaction_count"] = w3.eth.get_transaction_count(address)
-        except:
-            pass
+            result["transaction_count"] = transaction_count
+        except Exception:
+            log.debug("Balance lookup failed for %s on %s", address, network, exc_info=True)
         
         return result
     
-    # Get contract bytecode
-    try:
-        bytecode = w3.eth.get_code(address)
-        result["contract_code"] = bytecode.hex()
-    except:
-        pass
-    
     # Step 2: Check if network supports Etherscan API
-    chain_id = config["supported_chains"].get(network)
+    chain_id, _ = config.networks[network]
     # Networks with Etherscan support are those that have chain IDs (excluding solana and plasma)
     etherscan_supported = chain_id and network not in ["solana", "plasma"]
     
+    # None of the lookups depend on each other - run the proxy slot probe, the
+    # deployed state probe and the Etherscan queries concurrently. Each helper
+    # handles its own failures, so one failed fetch doesn't void the audit.
+    lookups = [
+        probe_proxy(w3, address, bytecode),
+        analyze_deployed_state(w3, address, network)
+    ]
     if etherscan_supported:
-        # Get contract creation info from Etherscan
-        creation_info = await get_contract_creation_info(address, network)
+        lookups += [
+            get_contract_creation_info(address, network, bypass_cache),
+            check_verification_status(address, network, bypass_cache)
+        ]
+    proxy_analysis, deployed_state, *etherscan_info = await asyncio.gather(*lookups)
+    
+    result["contract_code"] = bytecode.hex()
+    
+    if etherscan_supported:
+        creation_info, verification_info = etherscan_info
         if creation_info:
             result["contract_creator"] = creation_info.get("contract_creator")
             result["creation_tx"] = creation_info.get("tx_hash")
             result["creation_timestamp"] = creation_info.get("timestamp")
         
-        # Check verification status and get source code
-        verification_info = await check_verification_status(address, network)
+        # Verification status and source code
         result["is_verified"] = verification_info.get("is_verified", False)
         
         if result["is_verified"]:
@@ -141,9 +319,10 @@ async def analyze_contract(w3, address, network):
             
             # Detect contract standards
             if result["abi"]:
-                result["standards"] = detect_contract_standards(result["abi"])
-                result["function_signatures"] = extract_function_signatures(result["abi"])
-                result["event_signatures"] = extract_event_signatures(result["abi"])
+                abi_summary = summarize_abi(result["abi"])
+                result["standards"] = abi_summary["standards"]
+                result["function_signatures"] = abi_summary["functions"]
+                result["event_signatures"] = abi_summary["events"]
             
             # Perform security analysis
             if result["source_code"]:
@@ -157,37 +336,25 @@ async def analyze_contract(w3, address, network):
     
     # Always attempt bytecode analysis regardless of Etherscan support
     if result["contract_code"]:
-        result["probable_type"] = detect_contract_type_from_bytecode(result["contract_code"])
+        result["probable_type"] = detect_contract_type_from_bytecode(bytecode)
         
-        # Check for proxy patterns and analyze actual state
-        proxy_analysis = detect_proxy_patterns(w3, address, result["contract_code"])
         if proxy_analysis["is_proxy"]:
             result["proxy_analysis"] = proxy_analysis
-            result["deployed_state"] = await analyze_deployed_state(w3, address, network)
-            
-            # Update contract name with deployed state if available
-            if result["deployed_state"] and "token_info" in result["deployed_state"]:
-                deployed_name = result["deployed_state"]["token_info"].get("name")
-                if deployed_name:
-                    result["contract_name"] = deployed_name  # Set main contract name to deployed name
-                    result["deployed_contract_name"] = deployed_name
-                    result["deployed_symbol"] = result["deployed_state"]["token_info"].get("symbol")
+        
+        # Deployed state for every contract - proxies and plain token contracts alike
+        result["deployed_state"] = deployed_state
+        
+        # Update contract name with deployed state if available
+        if deployed_state and "token_info" in deployed_state:
+            deployed_name = deployed_state["token_info"].get("name")
+            if deployed_name:
+                result["contract_name"] = deployed_name  # Set main contract name to deployed name
+                result["deployed_contract_name"] = deployed_name
+                result["deployed_symbol"] = deployed_state["token_info"].get("symbol")
         
         # Enhanced bytecode analysis for non-Etherscan chains
         if not etherscan_supported:
-            result["bytecode_analysis"] = enhanced_bytecode_analysis(result["contract_code"])
-        
-        # Always try to get deployed state for token contracts (even non-proxies)
-        if not proxy_analysis["is_proxy"]:
-            result["deployed_state"] = await analyze_deployed_state(w3, address, network)
-            
-            # Update contract name with deployed state if available
-            if result["deployed_state"] and "token_info" in result["deployed_state"]:
-                deployed_name = result["deployed_state"]["token_info"].get("name")
-                if deployed_name:
-                    result["contract_name"] = deployed_name  # Set main contract name to deployed name
-                    result["deployed_contract_name"] = deployed_name
-                    result["deployed_symbol"] = result["deployed_state"]["token_info"].get("symbol")
+            result["bytecode_analysis"] = enhanced_bytecode_analysis(bytecode)
     
     return result
 
@@ -200,17 +367,12 @@ async def format_audit_output(audit_data, address, network, format_type):
         is_verified = audit_data.get("is_verified", False)
         
         # Get the appropriate prompt template
-        if format_type == "audit":
-            prompt_template = contract_security_audit_prompt()
-        elif format_type == "quick":
-            prompt_template = contract_quick_analysis_prompt()
-        elif format_type == "deep":
-            prompt_template = contract_deep_dive_prompt()
-        else:
+        prompt_template = AUDIT_TEMPLATES.get(format_type)
+        if prompt_template is None:
             return audit_data  # Return raw data if format not recognized
         
         # Format the prompt with actual data
-        formatted_prompt = prompt_template.format(
+        formatted_prompt = prompt_template.render(
             address=address,
             network=network,
             contract_name=contract_name,
@@ -237,19 +399,39 @@ async def format_audit_output(audit_data, address, network, format_type):
 
 
 async def check_if_contract(w3, address):
-    """Check if address is a contract"""
-    try:
-        code = w3.eth.get_code(address)
-        return code != b'\x00' and len(code) > 0
-    except:
-        return False
+    """
+    Fetch an address's code to check whether it is a contract.
+    
+    RPC failures propagate to the caller.
+    
+    Returns:
+        Tuple of (is contract, bytecode), so the code is only fetched once per audit
+    """
+    code = bytes(await w3.eth.get_code(address))
+    return code != b'\x00' and len(code) > 0, code
+
+
+async def probe_proxy(w3, address, bytecode):
+    """
+    Read the proxy storage slots and check them and the bytecode for proxy patterns.
+    
+    The slot reads are issued together, so they go out in one JSON-RPC batch.
+    
+    Returns:
+        Proxy analysis dictionary
+    """
+    slot_values = await asyncio.gather(
+        *(w3.eth.get_storage_at(address, slot) for slot in PROXY_SLOTS),
+        return_exceptions=True
+    )
+    return detect_proxy_patterns(bytecode, slot_values)
 
 
-async def get_contract_creation_info(address, network):
+async def get_contract_creation_info(address, network, bypass_cache=False):
     """Get contract creation information from Etherscan V2 API with multi-chain support"""
     try:
         # Get chain ID for the network
-        chain_id = config["supported_chains"].get(network)
+        chain_id, _ = config.networks.get(network, (None, None))
         if not chain_id:
             return None
         
@@ -259,30 +441,38 @@ async def get_contract_creation_info(address, network):
         if not etherscan_supported:
             return None
         
+        key = (chain_id, "getcontractcreation", address.lower())
+        if not bypass_cache:
+            cached = _cached_lookup(key)
+            if cached is not None:
+                return cached
+        
         # Use Etherscan V2 API for multichain support
-        url = f"{config['etherscan_v2_url']}?chainid={chain_id}&module=contract&action=getcontractcreation&contractaddresses={address}&apikey={config['etherscan_api_key']}"
-        response = requests.get(url, timeout=10)
-        data = response.json()
+        url = f"{config.etherscan_v2_url}?chainid={chain_id}&module=contract&action=getcontractcreation&contractaddresses={address}&apikey={config.etherscan_api_key}"
+        async with get_etherscan_session().get(url) as response:
+            data = orjson.loads(await response.read())
         
         if data.get("status") != "1" or not data.get("result") or not data["result"]:
             return None
         
         creation_data = data["result"][0]
-        return {
+        creation_info = {
             "contract_creator": creation_data.get("contractCreator"),
             "tx_hash": creation_data.get("txHash"),
             "timestamp": None  # Would need additional API call to get timestamp
         }
-    except Exception as e:
-        print(f"Error getting creation info for {network}: {e}")
+        _store_lookup(key, creation_info)
+        return creation_info
+    except Exception:
+        log.warning("Error getting creation info for %s", network, exc_info=True)
         return None
 
 
-async def check_verification_status(address, network):
+async def check_verification_status(address, network, bypass_cache=False):
     """Check if contract is verified on Etherscan V2 API with multi-chain support"""
     try:
         # Get chain ID for the network
-        chain_id = config["supported_chains"].get(network)
+        chain_id, _ = config.networks.get(network, (None, None))
         if not chain_id:
             return {"is_verified": False}
         
@@ -292,10 +482,16 @@ async def check_verification_status(address, network):
         if not etherscan_supported:
             return {"is_verified": False}
         
+        key = (chain_id, "getsourcecode", address.lower())
+        if not bypass_cache:
+            cached = _cached_lookup(key)
+            if cached is not None:
+                return cached
+        
         # Use Etherscan V2 API for multichain support
-        url = f"{config['etherscan_v2_url']}?chainid={chain_id}&module=contract&action=getsourcecode&address={address}&apikey={config['etherscan_api_key']}"
-        response = requests.get(url, timeout=10)
-        data = response.json()
+        url = f"{config.etherscan_v2_url}?chainid={chain_id}&module=contract&action=getsourcecode&address={address}&apikey={config.etherscan_api_key}"
+        async with get_etherscan_session().get(url) as response:
+            data = orjson.loads(await response.read())
         
         if data.get("status") != "1" or not data.get("result") or not data["result"]:
             return {"is_verified": False}
@@ -312,63 +508,128 @@ async def check_verification_status(address, network):
             result.update({
                 "contract_name": contract_data.get("ContractName"),
                 "source_code": source_code,
-                "abi": json.loads(contract_data.get("ABI", "[]")) if contract_data.get("ABI") else None
+                "abi": orjson.loads(contract_data["ABI"]) if contract_data.get("ABI") else None
             })
         
+        _store_lookup(key, result, ttl=None if is_verified else VERIFICATION_TTL)
         return result
-    except Exception as e:
-        print(f"Error checking verification status for {network}: {e}")
+    except Exception:
+        log.warning("Error checking verification status for %s", network, exc_info=True)
         return {"is_verified": False}
 
 
-def detect_contract_standards(abi):
-    """Detect contract standards (ERC20, ERC721, ERC1155)"""
-    if not abi or not isinstance(abi, list):
-        return {"is_erc20": False, "is_erc721": False, "is_erc1155": False}
+def summarize_abi(abi):
+    """
+    Extract function signatures, event signatures and standards from an ABI in one pass.
     
-    # Function signatures for different standards
-    erc20_functions = ['totalSupply', 'balanceOf', 'transfer', 'transferFrom', 'approve', 'allowance']
-    erc721_functions = ['balanceOf', 'ownerOf', 'safeTransferFrom', 'transferFrom', 'approve', 'getApproved', 'setApprovalForAll', 'isApprovedForAll']
-    erc1155_functions = ['balanceOf', 'balanceOfBatch', 'setApprovalForAll', 'isApprovedForAll', 'safeTransferFrom', 'safeBatchTransferFrom']
+    Args:
+        abi: Contract ABI as a list of entries
     
-    # Extract function names from ABI
-    function_names = [item["name"] for item in abi if item.get("type") == "function" and item.get("name")]
+    Returns:
+        Dictionary with "functions", "events" and "standards" (ERC20, ERC721, ERC1155)
+    """
+    functions = []
+    events = []
+    function_names = set()
     
-    # Check standard compliance
-    is_erc20 = all(func in function_names for func in erc20_functions)
-    is_erc721 = all(func in function_names for func in erc721_functions)
-    is_erc1155 = all(func in function_names for func in erc1155_functions)
+    if isinstance(abi, list):
+        for item in abi:
+            item_type = item.get("type")
+            if item_type != "function" and item_type != "event":
+                continue
+            
+            name = item.get("name", "")
+            signature = f"{name}({','.join([inp.get('type', '') for inp in item.get('inputs', [])])})"
+            
+            if item_type == "event":
+                events.append({"name": name, "signature": signature})
+                continue
+            
+            output_types = [out.get("type", "") for out in item.get("outputs", [])]
+            if output_types:
+                signature += f" returns ({','.join(output_types)})"
+            
+            functions.append({
+                "name": name,
+                "signature": signature,
+                "state_mutability": item.get("stateMutability", ""),
+                "visibility": item.get("visibility", "public")
+            })
+            if name:
+                function_names.add(name)
     
     return {
-        "is_erc20": is_erc20,
-        "is_erc721": is_erc721,
-        "is_erc1155": is_erc1155
+        "functions": functions,
+        "events": events,
+        "standards": {
+            "is_erc20": ERC20_FUNCTIONS <= function_names,
+            "is_erc721": ERC721_FUNCTIONS <= function_names,
+            "is_erc1155": ERC1155_FUNCTIONS <= function_names
+        }
     }
 
 
+def find_bytecode_patterns(bytecode):
+    """
+    Scan bytecode once for every known pattern.
+    
+    The type, proxy and enhanced bytecode checks all test the same code,
+    so the scan is shared between them instead of repeated per helper.
+    Searching the raw bytes reads half the data of the hex string and only
+    matches on byte boundaries. Results are cached by a fingerprint of the
+    code, since factory-deployed contracts share bytecode.
+    
+    Args:
+        bytecode: Contract bytecode as bytes
+    
+    Returns:
+        Frozenset of the BYTECODE_PATTERNS (hex form) present in the bytecode
+    """
+    fingerprint = hashlib.blake2b(bytecode, digest_size=16).digest()
+    found = _pattern_cache.get(fingerprint)
+    if found is None:
+        found = frozenset(pattern for pattern, regex in BYTECODE_PATTERN_BYTES.items() if regex.search(bytecode))
+        _pattern_cache.set(fingerprint, found)
+    return found
+
+
 def detect_contract_type_from_bytecode(bytecode):
     """Attempt to detect contract type from bytecode"""
     if not bytecode:
         return "Unknown"
     
     # Look for common bytecode patterns
-    if "06fdde03" in bytecode and "95d89b41" in bytecode and "18160ddd" in bytecode:
+    found = find_bytecode_patterns(bytecode)
+    if "06fdde03" in found and "95d89b41" in found and "18160ddd" in found:
         return "Likely Token (ERC20/ERC721)"
     
-    if "01ffc9a7" in bytecode:
+    if "01ffc9a7" in found:
         return "Supports ERC165 Interface Detection"
     
-    if "e8a3d485" in bytecode:
+    if "e8a3d485" in found:
         return "Possible Uniswap-related contract"
     
-    if "6080604052" in bytecode:
+    if "6080604052" in found:
         return "Solidity 0.4.x+ Contract"
     
     return "Unknown Contract Type"
 
 
-def detect_proxy_patterns(w3, address, bytecode):
-    """Detect proxy patterns in contract bytecode and analyze proxy state"""
+def detect_proxy_patterns(bytecode, slot_values):
+    """
+    Detect proxies from their storage slots, falling back to bytecode patterns.
+    
+    A compliant EIP-1967 proxy keeps its implementation (or beacon) address in
+    a fixed slot, so a set slot is conclusive; the bytecode scan only catches
+    proxies that don't follow EIP-1967.
+    
+    Args:
+        bytecode: Contract bytecode as bytes
+        slot_values: Storage values (or exceptions) read from PROXY_SLOTS
+    
+    Returns:
+        Dictionary with the proxy type, implementation/admin/beacon addresses and confidence
+    """
     if not bytecode:
         return {"is_proxy": False}
     
@@ -377,54 +638,52 @@ def detect_proxy_patterns(w3, address, bytecode):
         "proxy_type": "Unknown",
         "implementation_address": None,
         "admin_address": None,
+        "beacon_address": None,
         "patterns_detected": [],
         "confidence": 0
     }
     
-    # Common proxy patterns
-    proxy_patterns = {
-        "360894a13ba1a3210667c828492db98dca3e2076cc3735a920a3ca505d382bbc": "OpenZeppelin Transparent Proxy",
-        "5c60da1b": "EIP-1967 Proxy",
-        "f851a440": "EIP-1822 Universal Proxy",
-        "4e487b71": "OpenZeppelin Upgradeable",
-        "a3f0ad74e8653cd": "Beacon Proxy"
-    }
+    *implementations, admin, beacon = [slot_address(value) for value in slot_values]
     
-    # Check for proxy patterns in bytecode
-    for pattern, proxy_type in proxy_patterns.items():
-        if pattern in bytecode:
-            analysis["is_proxy"] = True
-            analysis["proxy_type"] = proxy_type
-            analysis["patterns_detected"].append(f"Proxy pattern: {proxy_type}")
-            analysis["confidence"] = 0.8
-            break
+    # EIP-1967 slots first - a set implementation or beacon slot settles it
+    if implementations[0] or beacon:
+        if beacon:
+            proxy_type = "EIP-1967 Beacon Proxy"
+        elif admin:
+            proxy_type = "EIP-1967 Transparent Proxy"
+        else:
+            proxy_type = "EIP-1967 Proxy"
+        analysis["is_proxy"] = True
+        analysis["proxy_type"] = proxy_type
+        analysis["patterns_detected"].append(f"Storage slot: {proxy_type}")
+        analysis["confidence"] = 0.95
+    else:
+        # Check for proxy patterns in bytecode
+        found = find_bytecode_patterns(bytecode)
+        for pattern, proxy_type in PROXY_PATTERNS.items():
+            if pattern in found:
+                analysis["is_proxy"] = True
+                analysis["proxy_type"] = proxy_type
+                analysis["patterns_detected"].append(f"Proxy pattern: {proxy_type}")
+                analysis["confidence"] = 0.8
+                break
     
-    # If proxy detected, try to get implementation address
     if analysis["is_proxy"]:
-        try:
-            # Try different storage slots for implementation address
-            implementation_slots = [
-                "0x360894a13ba1a3210667c828492db98dca3e2076cc3735a920a3ca505d382bbc",  # EIP-1967
-                "0x7050c9e0f4ca769c69bd3a8ef740bc37934f8e2c036e5a4fd6e3cd362f230da",  # Alternative slot
-            ]
-            
-            for slot in implementation_slots:
-                try:
-                    storage_value = w3.eth.get_storage_at(address, int(slot, 16))
-                    if storage_value != b'\x00' * 32:
-                        # Convert to address (last 20 bytes)
-                        impl_address = '0x' + storage_value[-20:].hex()
-                        if w3.is_address(impl_address):
-                            analysis["implementation_address"] = w3.to_checksum_address(impl_address)
-                            break
-                except:
-                    continue
-        except:
-            pass
+        analysis["implementation_address"] = next((impl for impl in implementations if impl), None)
+        analysis["admin_address"] = admin
+        analysis["beacon_address"] = beacon
     
     return analysis
 
 
+def slot_address(storage_value):
+    """Decode the address stored in a storage slot, or None if the slot is empty or the read failed"""
+    if isinstance(storage_value, BaseException) or not any(storage_value):
+        return None
+    # Convert to address (last 20 bytes)
+    return to_checksum_address(storage_value[-20:])
+
+
 async def analyze_deployed_state(w3, address, network):
     """Analyze the actual deployed state of a contract (especially important for proxies)"""
     state_analysis = {
@@ -436,76 +695,41 @@ async def analyze_deployed_state(w3, address, network):
     }
     
     try:
-        # Use the dedicated token_metadata_tool for token information
-        token_metadata = token_metadata_tool(address, network)
-        
-        if "error" not in token_metadata:
-            # Extract token information from metadata tool
-            state_analysis["token_info"] = {
-                "name": token_metadata.get("name"),
-                "symbol": token_metadata.get("symbol"),
-                "decimals": token_metadata.get("decimals")
-            }
-            
-            state_analysis["supply_info"] = {
-                "total_supply": token_metadata.get("total_supply"),
-                "total_supply_formatted": token_metadata.get("total_supply_formatted")
-            }
-        else:
-            # Fallback: try to get basic token info directly
-            try:
-                standard_abi = [
-                    {"inputs": [], "name": "name", "outputs": [{"name": "", "type": "string"}], "stateMutability": "view", "type": "function"},
-                    {"inputs": [], "name": "symbol", "outputs": [{"name": "", "type": "string"}], "stateMutability": "view", "type": "function"},
-                    {"inputs": [], "name": "decimals", "outputs": [{"name": "", "type": "uint8"}], "stateMutability": "view", "type": "function"},
-                    {"inputs": [], "name": "totalSupply", "outputs": [{"name": "", "type": "uint256"}], "stateMutability": "view", "type": "function"}
-                ]
-                
-                contract = w3.eth.contract(address=address, abi=standard_abi)
-                
-                try:
-                    state_analysis["token_info"]["name"] = contract.functions.name().call()
-                except:
-                    pass
-                    
-                try:
-                    state_analysis["token_info"]["symbol"] = contract.functions.symbol().call()
-                except:
-                    pass
-                    
+        # Probe token metadata, owner and native balance with one Multicall3 eth_call;
+        # each probe may fail on its own since non-token contracts lack these functions
+        calls = [(address, selector) for _, selector, _ in DEPLOYED_STATE_CALLS]
+        calls.append(eth_balance_call(address))
+        results = await aggregate3(w3, network, calls)
+        
+        values = {}
+        for (key, _, output_type), (success, data) in zip(DEPLOYED_STATE_CALLS, results):
+            if success:
                 try:
-                    state_analysis["token_info"]["decimals"] = contract.functions.decimals().call()
-                except:
+                    values[key] = w3.codec.decode([output_type], data)[0]
+                except DecodingError:
                     pass
-                
-                try:
-                    total_supply = contract.functions.totalSupply().call()
-                    state_analysis["supply_info"]["total_supply"] = str(total_supply)
-                    if "decimals" in state_analysis["token_info"]:
-                        decimals = state_analysis["token_info"]["decimals"]
-                        formatted_supply = total_supply / (10 ** decimals)
-                        state_analysis["supply_info"]["total_supply_formatted"] = str(formatted_supply)
-                except:
-                    pass
-            except:
-                pass
         
-        # Get additional contract-specific information
-        try:
-            # Try to get owner information
-            owner_abi = [{"inputs": [], "name": "owner", "outputs": [{"name": "", "type": "address"}], "stateMutability": "view", "type": "function"}]
-            owner_contract = w3.eth.contract(address=address, abi=owner_abi)
-            owner = owner_contract.functions.owner().call()
-            state_analysis["owner_info"]["owner"] = owner
-        except:
-            pass
-        
-        # Get contract's native token balance
-        try:
-            contract_balance = w3.eth.get_balance(address)
-            state_analysis["balances"]["native_balance"] = str(w3.from_wei(contract_balance, 'ether'))
-        except:
-            pass
+        for key in ("name", "symbol", "decimals"):
+            if key in values:
+                state_analysis["token_info"][key] = values[key]
+        
+        if "total_supply" in values:
+            total_supply = values["total_supply"]
+            state_analysis["supply_info"]["total_supply"] = str(total_supply)
+            if "decimals" in values:
+                formatted_supply = format_units(total_supply, values["decimals"])
+                state_analysis["supply_info"]["total_supply_formatted"] = formatted_supply
+        
+        if "owner" in values:
+            state_analysis["owner_info"]["owner"] = w3.to_checksum_address(values["owner"])
+        
+        # getEthBalance only answers through Multicall3; ask the node directly otherwise
+        balance_success, balance_data = results[-1]
+        if balance_success and len(balance_data) == 32:
+            contract_balance = int.from_bytes(balance_data, "big")
+        else:
+            contract_balance = await w3.eth.get_balance(address)
+        state_analysis["balances"]["native_balance"] = str(w3.from_wei(contract_balance, 'ether'))
             
     except Exception as e:
         state_analysis["error"] = f"Error analyzing deployed state: {str(e)}"
@@ -519,34 +743,19 @@ def enhanced_bytecode_analysis(bytecode):
         return {"analysis": "No bytecode available", "confidence": 0}
     
     analysis = {
-        "bytecode_length": len(bytecode),
+        "bytecode_length": len(bytecode) * 2,  # In hex characters
         "patterns_detected": [],
         "likely_contract_type": "Unknown",
         "confidence": 0,
         "analysis": "Basic bytecode analysis"
     }
     
-    # Common function selectors and their meanings
-    function_selectors = {
-        "06fdde03": "name()",
-        "95d89b41": "symbol()", 
-        "18160ddd": "totalSupply()",
-        "70a08231": "balanceOf(address)",
-        "a9059cbb": "transfer(address,uint256)",
-        "23b872dd": "transferFrom(address,address,uint256)",
-        "095ea7b3": "approve(address,uint256)",
-        "8c5be1e5ebec7d5bd14f71427d1e84f3dd0314c0f7b2291e5b200ac8c7c3b925": "Approval(address,address,uint256)",
-        "ddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef": "Transfer(address,address,uint256)",
-        "01ffc9a7": "supportsInterface(bytes4)",
-        "6352211e": "ownerOf(uint256)",
-        "42842e0e": "safeTransferFrom(address,address,uint256)",
-        "b88d4fde": "safeTransferFrom(address,address,uint256,bytes)"
-    }
+    found = find_bytecode_patterns(bytecode)
     
     # Detect function selectors in bytecode
     detected_functions = []
-    for selector, function_name in function_selectors.items():
-        if selector in bytecode:
+    for selector, function_name in BYTECODE_FUNCTION_SELECTORS.items():
+        if selector in found:
             detected_functions.append(function_name)
             analysis["patterns_detected"].append(f"Function: {function_name}")
     
@@ -563,19 +772,19 @@ def enhanced_bytecode_analysis(bytecode):
             analysis["confidence"] = 0.6
     
     # Check for common DeFi patterns
-    if "e8a3d485" in bytecode:  # Uniswap V2 router
+    if "e8a3d485" in found:  # Uniswap V2 router
         analysis["likely_contract_type"] = "Likely DEX Router (Uniswap V2)"
         analysis["confidence"] = 0.9
         analysis["patterns_detected"].append("Uniswap V2 Router pattern")
     
     # Check for proxy patterns
-    if "6080604052" in bytecode and "360894a13ba1a3210667c828492db98dca3e2076cc3735a920a3ca505d382bbc" in bytecode:
+    if "6080604052" in found and "360894a13ba1a3210667c828492db98dca3e2076cc3735a920a3ca505d382bbc" in found:
         analysis["likely_contract_type"] = "Likely Proxy Contract"
         analysis["confidence"] = 0.7
         analysis["patterns_detected"].append("Proxy pattern detected")
     
     # Check for upgradeable contracts
-    if "4e487b71" in bytecode:  # OpenZeppelin upgradeable pattern
+    if "4e487b71" in found:  # OpenZeppelin upgradeable pattern
         analysis["patterns_detected"].append("Upgradeable contract pattern")
         analysis["confidence"] = min(analysis["confidence"] + 0.2, 1.0)
     
@@ -589,8 +798,15 @@ def analyze_contract_security(source_code):
     """Basic security analysis of contract source code"""
     issues = []
     
+    # One scan over the source, stopping once every pattern has been seen
+    seen = set()
+    for match in SECURITY_PATTERNS.finditer(source_code):
+        seen.add(match.lastgroup)
+        if len(seen) == SECURITY_PATTERNS.groups:
+            break
+    
     # Check for reentrancy vulnerabilities
-    if "call.value" in source_code and "ReentrancyGuard" not in source_code:
+    if "reentrancy" in seen and "guard" not in seen:
         issues.append({
             "severity": "High",
             "issue": "Potential reentrancy vulnerability",
@@ -598,7 +814,7 @@ def analyze_contract_security(source_code):
         })
     
     # Check for tx.origin usage
-    if "tx.origin" in source_code:
+    if "tx_origin" in seen:
         issues.append({
             "severity": "Medium",
             "issue": "tx.origin used for authentication",
@@ -606,7 +822,7 @@ def analyze_contract_security(source_code):
         })
     
     # Check for unchecked external calls
-    if (".call(" in source_code or ".delegatecall(" in source_code) and not any("require" in line and ".call" in line for line in source_code.split('\n')):
+    if "external_call" in seen and not CHECKED_CALL.search(source_code):
         issues.append({
             "severity": "Medium",
             "issue": "Unchecked external call",
@@ -614,7 +830,7 @@ def analyze_contract_security(source_code):
         })
     
     # Check for use of block.timestamp
-    if "block.timestamp" in source_code or "now" in source_code:
+    if "timestamp" in seen:
         issues.append({
             "severity": "Low",
             "issue": "Timestamp dependence",
@@ -622,7 +838,7 @@ def analyze_contract_security(source_code):
         })
     
     # Check for self-destruct without access control
-    if "selfdestruct" in source_code or "suicide" in source_code:
+    if "selfdestruct" in seen:
         issues.append({
             "severity": "High",
             "issue": "Unprotected self-destruct",
@@ -633,52 +849,3 @@ def analyze_contract_security(source_code):
         "issues_found": len(issues) > 0,
         "issues": issues
     }
-
-
-def extract_function_signatures(abi):
-    """Extract function signatures from contract ABI"""
-    if not abi:
-        return []
-    
-    functions = []
-    for item in abi:
-        if item.get("type") == "function":
-            inputs = item.get("inputs", [])
-            outputs = item.get("outputs", [])
-            
-            input_types = [inp.get("type", "") for inp in inputs]
-            output_types = [out.get("type", "") for out in outputs]
-            
-            signature = f"{item.get('name', '')}({','.join(input_types)})"
-            if output_types:
-                signature += f" returns ({','.join(output_types)})"
-            
-            functions.append({
-                "name": item.get("name", ""),
-                "signature": signature,
-                "state_mutability": item.get("stateMutability", ""),
-                "visibility": item.get("visibility", "public")
-            })
-    
-    return functions
-
-
-def extract_event_signatures(abi):
-    """Extract event signatures from contract ABI"""
-    if not abi:
-        return []
-    
-    events = []
-    for item in abi:
-        if item.get("type") == "event":
-            inputs = item.get("inputs", [])
-            input_types = [inp.get("type", "") for inp in inputs]
-            
-            signature = f"{item.get('name', '')}({','.join(input_types)})"
-            
-            events.append({
-                "name": item.get("name", ""),
-                "signature": signature
-            })
-    
-    return events
@@ -4,8 +4,11 @@ ERC20 Balance Tool
 Get ERC20 token balance for any address on supported networks.
 """
 
-from web3 import Web3
 from config import config
+from tools._address import checksum_address
+from tools._multicall import call_functions
+from tools._rpc import get_w3
+from tools._tokens import format_units
 
 # Standard ERC20 ABI for common functions
 ERC20_ABI = [
@@ -40,7 +43,7 @@ ERC20_ABI = [
 ]
 
 
-def erc20_balance_tool(address: str, token_address: str, network: str = "mainnet") -> dict:
+async def erc20_balance_tool(address: str, token_address: str, network: str = "mainnet") -> dict:
     """
     Get ERC20 token balance for a given address.
     
@@ -53,27 +56,27 @@ def erc20_balance_tool(address: str, token_address: str, network: str = "mainnet
         Dictionary containing token balance information
     """
     try:
-        if network not in config["rpc_urls"]:
-            raise ValueError(f"Network {network} not supported")
+        network = config.resolve_network(network)
+        # Checksum once so web3 accepts addresses in any case
+        address = checksum_address(address)
+        token_address = checksum_address(token_address)
         
-        # Create Web3 instance
-        w3 = Web3(Web3.HTTPProvider(config["rpc_urls"][network]))
-        
-        # Check if connected
-        if not w3.is_connected():
-            raise ConnectionError(f"Failed to connect to {network} network")
+        # Shared Web3 instance; connection problems surface from the first real call
+        w3 = get_w3(network)
         
         # Create contract instance
         contract = w3.eth.contract(address=token_address, abi=ERC20_ABI)
         
-        # Get token information and balance
-        balance_wei = contract.functions.balanceOf(address).call()
-        decimals = contract.functions.decimals().call()
-        symbol = contract.functions.symbol().call()
-        name = contract.functions.name().call()
+        # Get token information and balance in a single Multicall3 call
+        balance_wei, decimals, symbol, name = await call_functions(w3, network, contract, [
+            ("balanceOf", [address], "uint256"),
+            ("decimals", [], "uint8"),
+            ("symbol", [], "string"),
+            ("name", [], "string"),
+        ])
         
         # Convert balance to human readable format
-        balance_formatted = balance_wei / (10 ** decimals)
+        balance_formatted = format_units(balance_wei, decimals)
         
         return {
             "address": address,
@@ -81,7 +84,7 @@ def erc20_balance_tool(address: str, token_address: str, network: str = "mainnet
             "network": network,
             "token_name": name,
             "token_symbol": symbol,
-            "balance": str(balance_formatted),
+            "balance": balance_formatted,
             "raw_balance": str(balance_wei),
             "decimals": decimals
         }
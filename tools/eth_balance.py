@@ -4,11 +4,12 @@ ETH Balance Tool
 Get native ETH balance for any address on supported networks.
 """
 
-from web3 import Web3
 from config import config
+from tools._address import checksum_address
+from tools._rpc import get_w3
 
 
-def eth_balance_tool(address: str, network: str = "mainnet") -> dict:
+async def eth_balance_tool(address: str, network: str = "mainnet") -> dict:
     """
     Get ETH balance for a given address.
     
@@ -20,18 +21,15 @@ def eth_balance_tool(address: str, network: str = "mainnet") -> dict:
         Dictionary containing balance information
     """
     try:
-        if network not in config["rpc_urls"]:
-            raise ValueError(f"Network {network} not supported")
+        network = config.resolve_network(network)
+        # Checksum once so web3 accepts addresses in any case
+        address = checksum_address(address)
         
-        # Create Web3 instance
-        w3 = Web3(Web3.HTTPProvider(config["rpc_urls"][network]))
-        
-        # Check if connected
-        if not w3.is_connected():
-            raise ConnectionError(f"Failed to connect to {network} network")
+        # Shared Web3 instance; connection problems surface from the first real call
+        w3 = get_w3(network)
         
         # Get balance in wei
-        balance_wei = w3.eth.get_balance(address)
+        balance_wei = await w3.eth.get_balance(address)
         
         # Convert to ETH
         balance_eth = w3.from_wei(balance_wei, 'ether')
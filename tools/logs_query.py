@@ -4,11 +4,75 @@ Logs Query Tool
 Query contract logs by topic and block range on supported networks.
 """
 
-from web3 import Web3
+import asyncio
+import re
+
+from web3.exceptions import Web3RPCError
+
 from config import config
+from tools._address import checksum_address
+from tools._rpc import get_w3
+
+# Times a range may be halved after result-cap errors (at most 2**5 = 32 requests)
+MAX_SPLIT_DEPTH = 5
+
+# Provider result-cap errors meaning the range should be split, e.g.
+# "query returned more than 10000 results", "Log response size exceeded",
+# "block range too large", "exceed maximum block range: 5000"
+LOG_LIMIT_ERROR = re.compile(
+    r"returned more than \d+ results"
+    r"|too many (?:results|logs|blocks)"
+    r"|response size (?:exceeded|is larger)"
+    r"|query exceeds max results"
+    r"|block range (?:is )?too (?:large|wide|big)"
+    r"|exceeds? (?:the )?max(?:imum)? block range"
+    r"|up to a [\d,]+ block range",
+    re.IGNORECASE
+)
+
+# Throttling answers are never split - splitting multiplies the requests being throttled
+RATE_LIMIT_ERROR = re.compile(r"rate.?limit|too many requests|capacity|throttl|request count|\b429\b", re.IGNORECASE)
+
+
+def is_result_cap_error(error):
+    """True if a provider error says the range had too many results, not that it was throttled"""
+    message = str(error)
+    return bool(LOG_LIMIT_ERROR.search(message)) and not RATE_LIMIT_ERROR.search(message)
+
+
+async def get_logs_range(w3, filter_params, from_block, to_block, slots, depth=0):
+    """
+    Fetch logs for one block range, halving it while the provider says it has too many results.
+    
+    The halves are fetched concurrently, so they share JSON-RPC batches. After
+    MAX_SPLIT_DEPTH halvings the provider's error is raised instead.
+    
+    Args:
+        w3: AsyncWeb3 instance for the network
+        filter_params: eth_getLogs filter without the block range
+        from_block: First block of the range
+        to_block: Last block of the range (inclusive)
+        slots: Semaphore bounding the eth_getLogs requests in flight
+        depth: How many times this range has already been halved
+    
+    Returns:
+        List of logs in block order
+    """
+    try:
+        async with slots:
+            return await w3.eth.get_logs({**filter_params, 'fromBlock': from_block, 'toBlock': to_block})
+    except Web3RPCError as e:
+        if from_block >= to_block or depth >= MAX_SPLIT_DEPTH or not is_result_cap_error(e):
+            raise
+    middle = (from_block + to_block) // 2
+    lower, upper = await asyncio.gather(
+        get_logs_range(w3, filter_params, from_block, middle, slots, depth + 1),
+        get_logs_range(w3, filter_params, middle + 1, to_block, slots, depth + 1)
+    )
+    return lower + upper
 
 
-def logs_tool(contract_address: str, topic: str = None, from_block: int = None, to_block: int = None, network: str = "mainnet") -> dict:
+async def logs_tool(contract_address: str, topic: str = None, from_block: int = None, to_block: int = None, network: str = "mainnet") -> dict:
     """
     Query contract logs by topic and block range.
     
@@ -23,19 +87,16 @@ def logs_tool(contract_address: str, topic: str = None, from_block: int = None,
         Dictionary containing log information
     """
     try:
-        if network not in config["rpc_urls"]:
-            raise ValueError(f"Network {network} not supported")
-        
-        # Create Web3 instance
-        w3 = Web3(Web3.HTTPProvider(config["rpc_urls"][network]))
+        network = config.resolve_network(network)
+        # Checksum once so web3 accepts addresses in any case
+        contract_address = checksum_address(contract_address)
         
-        # Check if connected
-        if not w3.is_connected():
-            raise ConnectionError(f"Failed to connect to {network} network")
+        # Shared Web3 instance; connection problems surface from the first real call
+        w3 = get_w3(network)
         
         # Get latest block if to_block not specified
         if to_block is None:
-            to_block = w3.eth.block_number
+            to_block = await w3.eth.block_number
         
         # Set from_block if not specified
         if from_block is None:
@@ -43,8 +104,6 @@ def logs_tool(contract_address: str, topic: str = None, from_block: int = None,
         
         # Prepare filter parameters
         filter_params = {
-            'fromBlock': from_block,
-            'toBlock': to_block,
             'address': contract_address
         }
         
@@ -52,8 +111,9 @@ def logs_tool(contract_address: str, topic: str = None, from_block: int = None,
         if topic:
             filter_params['topics'] = [topic]
         
-        # Get logs
-        logs = w3.eth.get_logs(filter_params)
+        # Ask for the whole range at once; it is only split if the provider caps the results
+        slots = asyncio.Semaphore(config.limits.max_concurrent_requests)
+        logs = await get_logs_range(w3, filter_params, from_block, to_block, slots)
         
         # Format logs for output
         formatted_logs = []
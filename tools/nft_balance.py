@@ -4,8 +4,10 @@ NFT Balance Tool
 Get ERC721/ERC1155 NFT balances for any address on supported networks.
 """
 
-from web3 import Web3
 from config import config
+from tools._address import checksum_address
+from tools._multicall import try_call_functions
+from tools._rpc import get_w3
 
 # ERC721 ABI for balanceOf
 ERC721_ABI = [
@@ -54,7 +56,16 @@ ERC1155_ABI = [
 ]
 
 
-def nft_balance_tool(address: str, nft_contract: str, token_id: int = None, network: str = "mainnet") -> dict:
+def describe_failures(calls, values):
+    """Name the probe calls that reverted or returned nothing decodable"""
+    return "; ".join(
+        f"{fn_name}() call failed on {contract.address}"
+        for (contract, fn_name, _, _), value in zip(calls, values)
+        if value is None
+    )
+
+
+async def nft_balance_tool(address: str, nft_contract: str, token_id: int = None, network: str = "mainnet") -> dict:
     """
     Get NFT balance for a given address.
     
@@ -68,23 +79,35 @@ def nft_balance_tool(address: str, nft_contract: str, token_id: int = None, netw
         Dictionary containing NFT balance information
     """
     try:
-        if network not in config["rpc_urls"]:
-            raise ValueError(f"Network {network} not supported")
+        network = config.resolve_network(network)
+        # Checksum once so web3 accepts addresses in any case
+        address = checksum_address(address)
+        nft_contract = checksum_address(nft_contract)
+        
+        # Shared Web3 instance; connection problems surface from the first real call
+        w3 = get_w3(network)
         
-        # Create Web3 instance
-        w3 = Web3(Web3.HTTPProvider(config["rpc_urls"][network]))
+        # Probe ERC721 and, given a token id, ERC1155 in one Multicall3 call;
+        # whichever standard answers every call decides the result
+        erc721 = w3.eth.contract(address=nft_contract, abi=ERC721_ABI)
+        erc721_calls = [
+            (erc721, "balanceOf", [address], "uint256"),
+            (erc721, "name", [], "string"),
+            (erc721, "symbol", [], "string"),
+        ]
+        erc1155_calls = []
+        if token_id is not None:
+            erc1155 = w3.eth.contract(address=nft_contract, abi=ERC1155_ABI)
+            erc1155_calls = [
+                (erc1155, "balanceOf", [address, token_id], "uint256"),
+                (erc1155, "uri", [token_id], "string"),
+            ]
         
-        # Check if connected
-        if not w3.is_connected():
-            raise ConnectionError(f"Failed to connect to {network} network")
+        values = await try_call_functions(w3, network, erc721_calls + erc1155_calls)
+        erc721_values, erc1155_values = values[:len(erc721_calls)], values[len(erc721_calls):]
         
-        # Try ERC721 first
-        try:
-            contract = w3.eth.contract(address=nft_contract, abi=ERC721_ABI)
-            balance = contract.functions.balanceOf(address).call()
-            name = contract.functions.name().call()
-            symbol = contract.functions.symbol().call()
-            
+        if None not in erc721_values:
+            balance, name, symbol = erc721_values
             return {
                 "address": address,
                 "nft_contract": nft_contract,
@@ -95,39 +118,35 @@ def nft_balance_tool(address: str, nft_contract: str, token_id: int = None, netw
                 "standard": "ERC721",
                 "token_id": None
             }
-            
-        except Exception as erc721_error:
-            # Try ERC1155 if ERC721 fails
-            if token_id is None:
-                return {
-                    "error": f"ERC721 failed: {str(erc721_error)}. For ERC1155, token_id is required.",
-                    "address": address,
-                    "nft_contract": nft_contract,
-                    "network": network
-                }
-            
-            try:
-                contract = w3.eth.contract(address=nft_contract, abi=ERC1155_ABI)
-                balance = contract.functions.balanceOf(address, token_id).call()
-                uri = contract.functions.uri(token_id).call()
-                
-                return {
-                    "address": address,
-                    "nft_contract": nft_contract,
-                    "network": network,
-                    "balance": str(balance),
-                    "standard": "ERC1155",
-                    "token_id": token_id,
-                    "uri": uri
-                }
-                
-            except Exception as erc1155_error:
-                return {
-                    "error": f"Both ERC721 and ERC1155 failed. ERC721: {str(erc721_error)}, ERC1155: {str(erc1155_error)}",
-                    "address": address,
-                    "nft_contract": nft_contract,
-                    "network": network
-                }
+        
+        erc721_error = describe_failures(erc721_calls, erc721_values)
+        if token_id is None:
+            return {
+                "error": f"ERC721 failed: {erc721_error}. For ERC1155, token_id is required.",
+                "address": address,
+                "nft_contract": nft_contract,
+                "network": network
+            }
+        
+        if None not in erc1155_values:
+            balance, uri = erc1155_values
+            return {
+                "address": address,
+                "nft_contract": nft_contract,
+                "network": network,
+                "balance": str(balance),
+                "standard": "ERC1155",
+                "token_id": token_id,
+                "uri": uri
+            }
+        
+        erc1155_error = describe_failures(erc1155_calls, erc1155_values)
+        return {
+            "error": f"Both ERC721 and ERC1155 failed. ERC721: {erc721_error}, ERC1155: {erc1155_error}",
+            "address": address,
+            "nft_contract": nft_contract,
+            "network": network
+        }
         
     except Exception as e:
         return {
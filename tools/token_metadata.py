@@ -4,8 +4,16 @@ Token Metadata Tool
 Get cached token metadata (name, symbol, decimals) for ERC20 tokens.
 """
 
-from web3 import Web3
+import asyncio
+
 from config import config
+from tools._address import checksum_address
+from tools._multicall import call_functions
+from tools._rpc import get_w3
+from tools._tokens import cached_token_fields, format_units, remember_token_fields
+
+# Immutable metadata fields, cached after the first read
+METADATA_FIELDS = ("name", "symbol", "decimals")
 
 # Standard ERC20 ABI for metadata
 ERC20_METADATA_ABI = [
@@ -40,7 +48,7 @@ ERC20_METADATA_ABI = [
 ]
 
 
-def token_metadata_tool(token_address: str, network: str = "mainnet") -> dict:
+async def token_metadata_tool(token_address: str, network: str = "mainnet") -> dict:
     """
     Get token metadata for an ERC20 token.
     
@@ -52,27 +60,39 @@ def token_metadata_tool(token_address: str, network: str = "mainnet") -> dict:
         Dictionary containing token metadata
     """
     try:
-        if network not in config["rpc_urls"]:
-            raise ValueError(f"Network {network} not supported")
+        network = config.resolve_network(network)
+        # Checksum once so web3 accepts addresses in any case
+        token_address = checksum_address(token_address)
         
-        # Create Web3 instance
-        w3 = Web3(Web3.HTTPProvider(config["rpc_urls"][network]))
-        
-        # Check if connected
-        if not w3.is_connected():
-            raise ConnectionError(f"Failed to connect to {network} network")
+        # Shared Web3 instance; connection problems surface from the first real call
+        w3 = get_w3(network)
         
         # Create contract instance
         contract = w3.eth.contract(address=token_address, abi=ERC20_METADATA_ABI)
         
-        # Get token metadata
-        name = contract.functions.name().call()
-        symbol = contract.functions.symbol().call()
-        decimals = contract.functions.decimals().call()
-        total_supply = contract.functions.totalSupply().call()
+        # Name, symbol and decimals never change - only read them on a cache miss
+        metadata = cached_token_fields(network, token_address, METADATA_FIELDS)
+        queries = [("totalSupply", [], "uint256")]
+        if metadata is None:
+            queries = [
+                ("name", [], "string"),
+                ("symbol", [], "string"),
+                ("decimals", [], "uint8"),
+            ] + queries
+        
+        # Get token metadata in one Multicall3 call, batched with the latest block lookup
+        values, latest_block = await asyncio.gather(
+            call_functions(w3, network, contract, queries),
+            w3.eth.get_block('latest')
+        )
+        *fetched, total_supply = values
+        if metadata is None:
+            metadata = tuple(fetched)
+            remember_token_fields(network, token_address, **dict(zip(METADATA_FIELDS, metadata)))
+        name, symbol, decimals = metadata
         
         # Format total supply
-        total_supply_formatted = total_supply / (10 ** decimals)
+        total_supply_formatted = format_units(total_supply, decimals)
         
         return {
             "token_address": token_address,
@@ -81,9 +101,9 @@ def token_metadata_tool(token_address: str, network: str = "mainnet") -> dict:
             "symbol": symbol,
             "decimals": decimals,
             "total_supply": str(total_supply),
-            "total_supply_formatted": str(total_supply_formatted),
+            "total_supply_formatted": total_supply_formatted,
             "cached": True,
-            "timestamp": w3.eth.get_block('latest').timestamp
+            "timestamp": latest_block.timestamp
         }
         
     except Exception as e:
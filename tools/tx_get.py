@@ -4,12 +4,37 @@ Enhanced Transaction Fetcher Tool
 Get detailed transaction information including ERC-20 transfers, contract interactions, and decoded data.
 """
 
-from web3 import Web3
+import asyncio
 import json
 from config import config
+from eth_abi.exceptions import DecodingError
+from tools._multicall import aggregate3, call_functions
+from tools._rpc import get_w3
+from tools._tokens import cached_token_fields, format_units, remember_token_fields
 
+# Common function selectors
+FUNCTION_SELECTORS = {
+    'a9059cbb': 'transfer(address,uint256)',
+    '23b872dd': 'transferFrom(address,address,uint256)',
+    '095ea7b3': 'approve(address,uint256)',
+    '70a08231': 'balanceOf(address)',
+    '18160ddd': 'totalSupply()',
+    '06fdde03': 'name()',
+    '95d89b41': 'symbol()',
+    '313ce567': 'decimals()'
+}
 
-def tx_get_tool(tx_hash: str, network: str = "mainnet") -> dict:
+# The same table keyed by the raw 4 selector bytes, matched against input bytes directly
+SELECTOR_NAMES = {bytes.fromhex(selector): name for selector, name in FUNCTION_SELECTORS.items()}
+
+# ERC-20 decimals() selector, called without building a contract object
+DECIMALS_SELECTOR = bytes.fromhex('313ce567')
+
+# ERC-20 Transfer(address,address,uint256) event signature
+TRANSFER_TOPIC = bytes.fromhex('ddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef')
+
+
+async def tx_get_tool(tx_hash: str, network: str = "mainnet") -> dict:
     """
     Get enhanced transaction details including ERC-20 transfers and decoded data.
     
@@ -21,43 +46,33 @@ def tx_get_tool(tx_hash: str, network: str = "mainnet") -> dict:
         Dictionary containing detailed transaction information
     """
     try:
-        if network not in config["rpc_urls"]:
-            raise ValueError(f"Network {network} not supported")
+        network = config.resolve_network(network)
         
-        # Create Web3 instance
-        w3 = Web3(Web3.HTTPProvider(config["rpc_urls"][network]))
-        
-        # Check if connected
-        if not w3.is_connected():
-            raise ConnectionError(f"Failed to connect to {network} network")
+        # Shared Web3 instance; connection problems surface from the first real call
+        w3 = get_w3(network)
         
         # Get transaction details
-        tx = w3.eth.get_transaction(tx_hash)
-        tx_receipt = w3.eth.get_transaction_receipt(tx_hash)
+        tx, tx_receipt = await asyncio.gather(
+            w3.eth.get_transaction(tx_hash),
+            w3.eth.get_transaction_receipt(tx_hash)
+        )
         
-        # Get block details
-        block = w3.eth.get_block(tx_receipt.blockNumber)
+        # Get block details while the receipt's logs are analyzed for token transfers
+        block, (erc20_transfers, nft_transfers, token_metadata) = await asyncio.gather(
+            w3.eth.get_block(tx_receipt.blockNumber),
+            analyze_token_activity(w3, network, tx_receipt.logs)
+        )
         
         # Calculate transaction fee
         gas_fee = tx_receipt.gasUsed * tx['gasPrice']
         gas_fee_eth = w3.from_wei(gas_fee, 'ether')
         
         # Decode transaction input data
-        input_data = tx.get('input', b'')
-        if hasattr(input_data, 'hex'):
-            input_data = input_data.hex()
-        elif isinstance(input_data, bytes):
-            input_data = input_data.hex()
-        
-        decoded_input = decode_transaction_input(input_data)
+        # The selector is read from the raw bytes; the hex form is only built for the response
+        input_bytes = bytes(tx.get('input', b''))
+        input_data = input_bytes.hex()
         
-        # Analyze logs for ERC-20 transfers
-        erc20_transfers = analyze_erc20_transfers(w3, tx_receipt.logs)
-        
-        # Get token metadata if it's a token interaction
-        token_metadata = None
-        if erc20_transfers:
-            token_metadata = get_token_metadata(w3, erc20_transfers[0]['token_address'])
+        decoded_input = decode_transaction_input(input_bytes, input_data)
         
         return {
             "tx_hash": tx_hash,
@@ -81,8 +96,9 @@ def tx_get_tool(tx_hash: str, network: str = "mainnet") -> dict:
             "input_data": input_data,
             "decoded_input": decoded_input,
             "erc20_transfers": erc20_transfers,
+            "nft_transfers": nft_transfers,
             "token_metadata": token_metadata,
-            "transaction_type": determine_transaction_type(tx, erc20_transfers)
+            "transaction_type": determine_transaction_type(tx, erc20_transfers, nft_transfers)
         }
         
     except Exception as e:
@@ -93,104 +109,177 @@ def tx_get_tool(tx_hash: str, network: str = "mainnet") -> dict:
         }
 
 
-def decode_transaction_input(input_data):
-    """Decode transaction input data"""
-    if not input_data or input_data == '0x':
+def decode_transaction_input(input_bytes, raw_input):
+    """
+    Decode transaction input data.
+    
+    Args:
+        input_bytes: The transaction input as bytes
+        raw_input: The same input hex-encoded, echoed back in the result
+    
+    Returns:
+        Dictionary with the function selector and name, or None without a selector
+    """
+    if len(input_bytes) < 4:
         return None
     
-    try:
-        # Common function selectors
-        function_selectors = {
-            'a9059cbb': 'transfer(address,uint256)',
-            '23b872dd': 'transferFrom(address,address,uint256)',
-            '095ea7b3': 'approve(address,uint256)',
-            '70a08231': 'balanceOf(address)',
-            '18160ddd': 'totalSupply()',
-            '06fdde03': 'name()',
-            '95d89b41': 'symbol()',
-            '313ce567': 'decimals()'
+    selector = input_bytes[:4].hex()
+    function_name = SELECTOR_NAMES.get(input_bytes[:4]) or f'Unknown function (0x{selector})'
+    
+    return {
+        "function_selector": selector,
+        "function_name": function_name,
+        "raw_input": raw_input
+    }
+
+
+async def analyze_token_activity(w3, network, logs):
+    """
+    Analyze logs for token transfers and fetch metadata for the first ERC-20 token.
+    
+    Returns:
+        Tuple of (ERC-20 transfers, ERC-721 transfers, token metadata or None)
+    """
+    decoded = decode_transfers(logs)
+    erc20_transfers = await analyze_erc20_transfers(w3, network, [
+        (token_address, from_addr, to_addr, amount)
+        for token_address, from_addr, to_addr, amount, token_id in decoded
+        if token_id is None
+    ])
+    nft_transfers = [
+        {
+            "token_address": token_address,
+            "from": from_addr,
+            "to": to_addr,
+            "token_id": str(token_id)
         }
-        
-        if len(input_data) >= 10:
-            selector = input_data[:10]
-            function_name = function_selectors.get(selector, f'Unknown function (0x{selector})')
-            
-            return {
-                "function_selector": selector,
-                "function_name": function_name,
-                "raw_input": input_data
-            }
-    except:
-        pass
-    
-    return None
-
-
-def analyze_erc20_transfers(w3, logs):
-    """Analyze logs for ERC-20 transfer events"""
-    transfers = []
+        for token_address, from_addr, to_addr, _, token_id in decoded
+        if token_id is not None
+    ]
     
-    # ERC-20 Transfer event signature
-    transfer_topic = 'ddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef'
+    # Get token metadata if it's an ERC-20 interaction
+    token_metadata = None
+    if erc20_transfers:
+        token_metadata = await get_token_metadata(w3, network, erc20_transfers[0]['token_address'])
     
+    return erc20_transfers, nft_transfers, token_metadata
+
+
+def decode_transfers(logs):
+    """
+    Decode Transfer events straight from the log bytes.
+    
+    ERC-721 shares the ERC-20 signature but indexes the token id as a fourth
+    topic; those logs are kept and carry the token id.
+    
+    Args:
+        logs: Receipt logs
+    
+    Returns:
+        List of (token address, from, to, amount, token id) tuples in log order;
+        token id is None for ERC-20 transfers
+    """
+    decoded = []
     for log in logs:
-        try:
-            # Convert topics to hex strings
-            topics_hex = [topic.hex() for topic in log.topics]
-            
-            if len(topics_hex) >= 3 and topics_hex[0] == transfer_topic:
-                # Decode transfer event
-                from_addr = '0x' + topics_hex[1][26:]  # Remove padding
-                to_addr = '0x' + topics_hex[2][26:]   # Remove padding
-                
-                # Get token address
-                token_address = log.address
-                
-                # Decode amount from data
-                data_hex = log.data.hex()
-                if data_hex.startswith('0x'):
-                    data_hex = data_hex[2:]
-                amount = int(data_hex, 16) if data_hex else 0
-                
-                # Get token decimals
-                decimals = get_token_decimals(w3, token_address)
-                formatted_amount = amount / (10 ** decimals) if decimals else amount
-                
-                transfers.append({
-                    "token_address": token_address,
-                    "from": from_addr,
-                    "to": to_addr,
-                    "amount": str(amount),
-                    "amount_formatted": str(formatted_amount),
-                    "decimals": decimals
-                })
-        except Exception as e:
-            print(f"Error processing log: {e}")
+        topics = log.topics
+        if len(topics) < 3 or topics[0] != TRANSFER_TOPIC:
             continue
+        # Addresses are the low 20 bytes of each topic
+        from_addr = f"0x{topics[1][12:].hex()}"
+        to_addr = f"0x{topics[2][12:].hex()}"
+        if len(topics) > 3:
+            decoded.append((log.address, from_addr, to_addr, 1, int.from_bytes(topics[3], 'big')))
+        else:
+            # The amount is the first data word
+            decoded.append((log.address, from_addr, to_addr, int.from_bytes(log.data[:32], 'big'), None))
+    return decoded
+
+
+async def analyze_erc20_transfers(w3, network, decoded):
+    """
+    Format decoded ERC-20 transfers with their token decimals.
+    
+    Args:
+        w3: AsyncWeb3 instance for the network
+        network: The network the tokens live on
+        decoded: List of (token address, from, to, amount) tuples
+    
+    Returns:
+        List of transfer dictionaries
+    """
+    # Fetch decimals once per distinct token, all in a single Multicall3 call
+    tokens = list(dict.fromkeys(token_address for token_address, _, _, _ in decoded))
+    decimals_by_token = await get_token_decimals(w3, network, tokens)
+    
+    transfers = []
+    for token_address, from_addr, to_addr, amount in decoded:
+        decimals = decimals_by_token[token_address]
+        formatted_amount = format_units(amount, decimals)
+        
+        transfers.append({
+            "token_address": token_address,
+            "from": from_addr,
+            "to": to_addr,
+            "amount": str(amount),
+            "amount_formatted": formatted_amount,
+            "decimals": decimals
+        })
     
     return transfers
 
 
-def get_token_decimals(w3, token_address):
-    """Get token decimals"""
-    try:
-        # ERC-20 decimals() function
-        decimals_abi = {
-            "inputs": [],
-            "name": "decimals",
-            "outputs": [{"name": "", "type": "uint8"}],
-            "stateMutability": "view",
-            "type": "function"
-        }
-        
-        contract = w3.eth.contract(address=token_address, abi=[decimals_abi])
-        return contract.functions.decimals().call()
-    except:
-        return 18  # Default to 18 decimals
+async def get_token_decimals(w3, network, token_addresses):
+    """
+    Get decimals for several tokens, cached per token once read.
+    
+    Args:
+        w3: AsyncWeb3 instance for the network
+        network: The network the tokens live on
+        token_addresses: Token contract addresses
+    
+    Returns:
+        Dictionary mapping each token address to its decimals
+    """
+    decimals_by_token = {}
+    missing = []
+    for token_address in token_addresses:
+        cached = cached_token_fields(network, token_address, ("decimals",))
+        if cached is not None:
+            decimals_by_token[token_address] = cached[0]
+        else:
+            missing.append(token_address)
+    
+    if not missing:
+        return decimals_by_token
+    
+    # ERC-20 decimals() takes no arguments, so the selector is the whole calldata
+    results = await aggregate3(w3, network, [(token_address, DECIMALS_SELECTOR) for token_address in missing])
+    for token_address, (success, data) in zip(missing, results):
+        if success:
+            try:
+                decimals = w3.codec.decode(["uint8"], data)[0]
+            except DecodingError:
+                success = False
+        if not success:
+            decimals_by_token[token_address] = 18  # Default to 18 decimals
+            continue
+        remember_token_fields(network, token_address, decimals=decimals)
+        decimals_by_token[token_address] = decimals
+    
+    return decimals_by_token
 
 
-def get_token_metadata(w3, token_address):
-    """Get basic token metadata"""
+async def get_token_metadata(w3, network, token_address):
+    """Get basic token metadata, cached per token once read"""
+    cached = cached_token_fields(network, token_address, ("name", "symbol", "decimals"))
+    if cached is not None:
+        name, symbol, decimals = cached
+        return {
+            "name": name,
+            "symbol": symbol,
+            "decimals": decimals
+        }
+    
     try:
         # ERC-20 standard functions
         abi = [
@@ -201,16 +290,23 @@ def get_token_metadata(w3, token_address):
         
         contract = w3.eth.contract(address=token_address, abi=abi)
         
+        name, symbol, decimals = await call_functions(w3, network, contract, [
+            ("name", [], "string"),
+            ("symbol", [], "string"),
+            ("decimals", [], "uint8"),
+        ])
+        remember_token_fields(network, token_address, name=name, symbol=symbol, decimals=decimals)
         return {
-            "name": contract.functions.name().call(),
-            "symbol": contract.functions.symbol().call(),
-            "decimals": contract.functions.decimals().call()
+            "name": name,
+            "symbol": symbol,
+            "decimals": decimals
         }
-    except:
+    except (ValueError, DecodingError):
+        # Reverted or non-standard getters; transport errors reach tx_get_tool's handler
         return None
 
 
-def determine_transaction_type(tx, erc20_transfers):
+def determine_transaction_type(tx, erc20_transfers, nft_transfers):
     """Determine the type of transaction"""
     if tx['value'] > 0:
         return "ETH Transfer"
@@ -219,6 +315,8 @@ def determine_transaction_type(tx, erc20_transfers):
             return f"ERC-20 Transfer ({erc20_transfers[0].get('token_symbol', 'Token')})"
         else:
             return "Multiple ERC-20 Transfers"
+    elif nft_transfers:
+        return "ERC-721 Transfer" if len(nft_transfers) == 1 else "Multiple ERC-721 Transfers"
     elif tx['to'] and tx['input'] and tx['input'] != '0x':
         return "Contract Interaction"
     else: